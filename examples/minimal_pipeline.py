@@ -1,185 +1,194 @@
 #!/usr/bin/env python3
 """
 Minimal pipeline: Test ClaimBundle + Gates end-to-end.
-No external dependencies. Runs in < 5 seconds.
+Only needs pytest. Runs in < 5 seconds.
 
 Purpose: Validate Phase 1 architecture before scaling to Phase 2.
+
+Run: python3 examples/minimal_pipeline.py   (or: pytest examples/minimal_pipeline.py)
 """
 
+import logging
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.claim_bundle import (
-    ClaimBundle, Claim, Uncertainty, EvidencePointer,
+    ClaimBundle, Claim, EvidencePointer, make_uncertainty,
     ClaimType, UncertaintyMethod, GateRecommendation, RiskTier
 )
 from src.gates import GateStack
 
+logger = logging.getLogger(__name__)
+
+
+# Shared, read-only building blocks (gates never mutate claims or evidence)
+
+@pytest.fixture(scope="module")
+def semantic_entropy_evidence():
+    """Nature 2024 semantic entropy paper as a high-confidence source."""
+    return EvidencePointer(
+        source="https://nature.com/articles/s41586-024-07421-0",
+        source_confidence=0.95,  # High confidence (Nature journal)
+        evidence_hash="bd24c2aaef2ef37ae95f0f9e5f7d9e7c"
+    )
+
+
+@pytest.fixture(scope="module")
+def moderate_uncertainty():
+    """Confidence-score uncertainty at the 0.5 midpoint."""
+    return make_uncertainty(
+        method=UncertaintyMethod.CONFIDENCE_SCORE,
+        value=0.5
+    )
+
 
-def test_hypothesis_001():
+@pytest.mark.parametrize("uncertainty_value,expected_pass", [
+    (0.15, True),   # Low uncertainty (strong empirical validation)
+    (0.85, False),  # Above the 0.75 defer threshold
+])
+def test_hypothesis_001(semantic_entropy_evidence, uncertainty_value, expected_pass):
     """
     H001: Semantic entropy can detect hallucinations.
-    
+
     For Phase 1, we mock this with a simple uncertainty score.
     In Phase 2, we'll implement actual semantic entropy.
     """
-    print("\n[TEST] H001: Semantic Entropy AUROC >= 0.75")
-    
+    logger.info("\n[TEST] H001: Semantic Entropy AUROC >= 0.75")
+
     # Create a claim about semantic entropy (from Nature 2024)
     claim = Claim(
         statement="Semantic entropy AUROC >= 0.78 for hallucination detection (Wang et al., Nature 2024)",
         claim_type=ClaimType.FACT,
-        evidence_pointers=[
-            EvidencePointer(
-                source="https://nature.com/articles/s41586-024-07421-0",
-                source_confidence=0.95,  # High confidence (Nature journal)
-                evidence_hash="bd24c2aaef2ef37ae95f0f9e5f7d9e7c"
-            )
-        ],
-        uncertainty=Uncertainty(
+        evidence_pointers=[semantic_entropy_evidence],
+        uncertainty=make_uncertainty(
             method=UncertaintyMethod.SEMANTIC_ENTROPY,
-            value=0.15,  # Low uncertainty (strong empirical validation)
+            value=uncertainty_value,
             interpretation="Semantic entropy successfully detects hallucinations",
             gate_recommendation=GateRecommendation.EXECUTE
         ),
         risk_tier=RiskTier.READ_ONLY
     )
-    
+
     # Create bundle
     bundle = ClaimBundle(
         origin_agent="research_agent",
         claims=[claim],
         reason="Validate H001: Semantic entropy effectiveness"
     )
-    
+
     # Run through gates
-    print(f"  Claim: {claim.statement[:60]}...")
-    print(f"  Evidence: {claim.evidence_pointers[0].source}")
-    print(f"  Uncertainty: {claim.uncertainty.value:.2f}")
-    
+    logger.info("  Claim: %s...", claim.statement[:60])
+    logger.info("  Evidence: %s", claim.evidence_pointers[0].source)
+    logger.info("  Uncertainty: %.2f", claim.uncertainty.value)
+
     result = GateStack.evaluate(bundle)
-    
-    print(f"  Gate Result: {result.gate_name}")
-    print(f"  Passed: {result.passed}")
-    print(f"  Decision: {bundle.decision.value}")
-    print(f"  Audit Trail Gates Passed: {bundle.audit_trail['gates_passed']}")
-    
-    assert result.passed, f"Gates failed: {result.reason}"
-    assert bundle.decision.value == "PUBLISH", f"Should publish but got {bundle.decision.value}"
-    print("  ✅ H001 validation passed!")
-
-
-def test_hypothesis_002():
+
+    logger.info("  Gate Result: %s", result.gate_name)
+    logger.info("  Passed: %s", result.passed)
+    logger.info("  Decision: %s", bundle.decision.value)
+    logger.info("  Audit Trail Gates Passed: %s", bundle.audit_trail['gates_passed'])
+
+    assert result.passed is expected_pass, f"Unexpected gate outcome: {result.reason}"
+    expected_decision = "PUBLISH" if expected_pass else "DEFER"
+    assert bundle.decision.value == expected_decision, \
+        f"Should be {expected_decision} but got {bundle.decision.value}"
+    logger.info("  ✅ H001 validation passed!")
+
+
+def test_hypothesis_002(moderate_uncertainty):
     """
     H002: Guardian agent reduces ASR (attack success rate).
-    
+
     For Phase 1, we test that adversarial gate logic works.
     In Phase 3, we'll train a real guardian agent.
     """
-    print("\n[TEST] H002: Guardian Agent Defense")
-    
+    logger.info("\n[TEST] H002: Guardian Agent Defense")
+
     # Normal action
     claim_normal = Claim(
         statement="Execute read operation",
         claim_type=ClaimType.DECISION,
         evidence_pointers=[],
-        uncertainty=Uncertainty(
-            method=UncertaintyMethod.CONFIDENCE_SCORE,
-            value=0.5
-        ),
+        uncertainty=moderate_uncertainty,
         risk_tier=RiskTier.READ_ONLY
     )
     bundle_normal = ClaimBundle(origin_agent="agent", claims=[claim_normal])
     result_normal = GateStack.evaluate(bundle_normal)
-    print(f"  Normal action passed: {result_normal.passed}")
+    logger.info("  Normal action passed: %s", result_normal.passed)
     assert result_normal.passed, "Normal action should pass"
-    
+
     # Adversarial action (simulated)
-    print("  ✅ H002 validation passed! (gates working correctly)")
+    logger.info("  ✅ H002 validation passed! (gates working correctly)")
 
 
 def test_hypothesis_003():
     """
     H003: MCP integration < 30 minutes.
-    
+
     For Phase 1, we verify the framework is ready for Phase 2 MCP work.
     """
-    print("\n[TEST] H003: MCP Integration Framework")
-    print("  Framework Status: Ready for MCP scaffold (Phase 2)")
-    print("  Contract Layer: Complete")
-    print("  Gate Stack: Complete")
-    print("  Next: LangGraph orchestration")
-    print("  ✅ H003 framework ready!")
+    logger.info("\n[TEST] H003: MCP Integration Framework")
+    logger.info("  Framework Status: Ready for MCP scaffold (Phase 2)")
+    logger.info("  Contract Layer: Complete")
+    logger.info("  Gate Stack: Complete")
+    logger.info("  Next: LangGraph orchestration")
+    logger.info("  ✅ H003 framework ready!")
 
 
-def test_hypothesis_004():
+@pytest.mark.parametrize("evidence_confidence,expect_valid", [
+    (0.9, True),    # Confident source
+    (None, False),  # FACT without evidence
+])
+def test_hypothesis_004(moderate_uncertainty, evidence_confidence, expect_valid):
     """
     H004: Claim integrity rate >= 95%.
-    
+
     For Phase 1, test that our validation logic works.
     """
-    print("\n[TEST] H004: Claim Integrity")
-    
-    # Valid claim
-    valid_claim = Claim(
-        statement="Valid claim",
-        claim_type=ClaimType.FACT,
-        evidence_pointers=[
-            EvidencePointer(
-                source="https://example.com",
-                source_confidence=0.9,
-                evidence_hash="valid123"
-            )
-        ],
-        uncertainty=Uncertainty(
-            method=UncertaintyMethod.CONFIDENCE_SCORE,
-            value=0.5
-        ),
-        risk_tier=RiskTier.READ_ONLY
-    )
-    errors = valid_claim.validate()
-    assert len(errors) == 0, f"Valid claim has errors: {errors}"
-    
-    # Invalid claim (FACT without evidence)
-    invalid_claim = Claim(
-        statement="Invalid claim",
+    logger.info("\n[TEST] H004: Claim Integrity")
+
+    evidence = [] if evidence_confidence is None else [
+        EvidencePointer(
+            source="https://example.com",
+            source_confidence=evidence_confidence,
+            evidence_hash="valid123"
+        )
+    ]
+    claim = Claim(
+        statement="Valid claim" if expect_valid else "Invalid claim",
         claim_type=ClaimType.FACT,
-        evidence_pointers=[],  # Missing evidence
-        uncertainty=Uncertainty(
-            method=UncertaintyMethod.CONFIDENCE_SCORE,
-            value=0.5
-        ),
+        evidence_pointers=evidence,
+        uncertainty=moderate_uncertainty,
         risk_tier=RiskTier.READ_ONLY
     )
-    errors = invalid_claim.validate()
-    assert len(errors) > 0, "Invalid claim should have errors"
-    
-    print(f"  Valid claims: 1/1 passed")
-    print(f"  Invalid claims correctly detected: {len(errors)} errors")
-    print("  ✅ H004 integrity validation working!")
+    errors = claim.validate()
+
+    if expect_valid:
+        assert len(errors) == 0, f"Valid claim has errors: {errors}"
+        logger.info("  Valid claims: 1/1 passed")
+    else:
+        assert len(errors) > 0, "Invalid claim should have errors"
+        logger.info("  Invalid claims correctly detected: %s errors", len(errors))
+    logger.info("  ✅ H004 integrity validation working!")
 
 
-def test_complex_scenario():
+def test_complex_scenario(semantic_entropy_evidence):
     """
     Real-world scenario: Multiple claims, mixed uncertainty levels.
     """
-    print("\n[TEST] Complex Scenario: Multi-claim Bundle")
-    
+    logger.info("\n[TEST] Complex Scenario: Multi-claim Bundle")
+
     claims = [
         Claim(
             statement="Semantic entropy detects hallucinations",
             claim_type=ClaimType.FACT,
-            evidence_pointers=[
-                EvidencePointer(
-                    source="https://nature.com/articles/s41586-024-07421-0",
-                    source_confidence=0.95,
-                    evidence_hash="bd24c2aa"
-                )
-            ],
-            uncertainty=Uncertainty(
+            evidence_pointers=[semantic_entropy_evidence],
+            uncertainty=make_uncertainty(
                 method=UncertaintyMethod.SEMANTIC_ENTROPY,
                 value=0.15
             ),
@@ -189,7 +198,7 @@ def test_complex_scenario():
             statement="Therefore, we can use semantic entropy as a gate",
             claim_type=ClaimType.INFERENCE,
             evidence_pointers=[],
-            uncertainty=Uncertainty(
+            uncertainty=make_uncertainty(
                 method=UncertaintyMethod.CONFIDENCE_SCORE,
                 value=0.65  # Moderate uncertainty
             ),
@@ -199,34 +208,34 @@ def test_complex_scenario():
             statement="The gate should be threshold-based",
             claim_type=ClaimType.DECISION,
             evidence_pointers=[],
-            uncertainty=Uncertainty(
+            uncertainty=make_uncertainty(
                 method=UncertaintyMethod.CONFIDENCE_SCORE,
                 value=0.85  # High uncertainty, should flag
             ),
             risk_tier=RiskTier.WRITE_LIMITED
         )
     ]
-    
+
     bundle = ClaimBundle(
         origin_agent="design_team",
         claims=claims,
         reason="Design uncertainty gate thresholds"
     )
-    
-    print(f"  Bundle ID: {bundle.id}")
-    print(f"  Claims: {len(claims)}")
-    print(f"  Mixed uncertainty levels: 0.15, 0.65, 0.85")
-    
+
+    logger.info("  Bundle ID: %s", bundle.id)
+    logger.info("  Claims: %s", len(claims))
+    logger.info("  Mixed uncertainty levels: 0.15, 0.65, 0.85")
+
     result = GateStack.evaluate(bundle)
-    
-    print(f"  Gate Result: {result.gate_name}")
-    print(f"  Passed: {result.passed}")
-    print(f"  Final Decision: {bundle.decision.value}")
-    print(f"  Audit Trail - Passed: {bundle.audit_trail['gates_passed']}")
+
+    logger.info("  Gate Result: %s", result.gate_name)
+    logger.info("  Passed: %s", result.passed)
+    logger.info("  Final Decision: %s", bundle.decision.value)
+    logger.info("  Audit Trail - Passed: %s", bundle.audit_trail['gates_passed'])
     if bundle.audit_trail['gates_failed']:
-        print(f"  Audit Trail - Failed: {bundle.audit_trail['gates_failed']}")
-    
-    print("  ✅ Complex scenario handled correctly!")
+        logger.info("  Audit Trail - Failed: %s", bundle.audit_trail['gates_failed'])
+
+    logger.info("  ✅ Complex scenario handled correctly!")
 
 
 if __name__ == "__main__":
@@ -242,18 +251,19 @@ Validating:
   5. Audit trail recording
   6. Bundle serialization
 """)
-    
-    try:
-        test_hypothesis_001()
-        test_hypothesis_002()
-        test_hypothesis_003()
-        test_hypothesis_004()
-        test_complex_scenario()
-        
-        print("\n" + "="*70)
-        print("✅ ALL PHASE 1 TESTS PASSED")
-        print("="*70)
-        print("""
+
+    exit_code = pytest.main([
+        __file__, "-v", "-p", "no:cacheprovider",
+        "-o", "log_cli=true", "--log-cli-level=INFO", "--log-cli-format=%(message)s",
+    ])
+    if exit_code != 0:
+        print("\n❌ TEST FAILED")
+        sys.exit(exit_code)
+
+    print("\n" + "="*70)
+    print("✅ ALL PHASE 1 TESTS PASSED")
+    print("="*70)
+    print("""
 Phase 1 Status: READY FOR DEPLOYMENT
 
 Next steps:
@@ -271,13 +281,3 @@ Summary:
 
 Architecture is solid. Ready for LangGraph integration.
 """)
-    except AssertionError as e:
-        print(f"\n❌ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        exit(1)
-    except Exception as e:
-        print(f"\n❌ ERROR: {e}")
-        import traceback
-        traceback.print_exc()
-        exit(1)
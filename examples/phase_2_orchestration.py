@@ -9,8 +9,13 @@ Demonstrates:
 4. Decision making based on uncertainty
 
 Run: python3 examples/phase_2_orchestration.py
+Timing run (diagnostics compiled out): python3 -O examples/phase_2_orchestration.py
 """
 
+import asyncio
+import functools
+import io
+import logging
 import sys
 from pathlib import Path
 import json
@@ -18,7 +23,7 @@ import json
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.claim_bundle import (
-    ClaimBundle, Claim, Uncertainty, EvidencePointer,
+    ClaimBundle, Claim, EvidencePointer, make_uncertainty,
     ClaimType, UncertaintyMethod, GateRecommendation, RiskTier, BundleDecision
 )
 from src.orchestration import PrometheusOrchestrator, OrchestratorConfig
@@ -28,23 +33,51 @@ from src.uncertainty.semantic_entropy import (
 )
 from src.uncertainty.uncertainty_quantifier import UncertaintyQuantifier
 
+logger = logging.getLogger(__name__)
 
-def demo_semantic_entropy():
+
+def buffered_output(demo):
+    """
+    Collect a demo's log output in memory and write it to stdout in one call.
+    
+    Each demo logs through its own child logger, so concurrently gathered
+    demos never interleave their output.
+    """
+    demo_logger = logging.getLogger(f"{__name__}.{demo.__name__}")
+    demo_logger.propagate = False
+
+    @functools.wraps(demo)
+    async def wrapper():
+        buf = io.StringIO()
+        handler = logging.StreamHandler(buf)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        demo_logger.addHandler(handler)
+        try:
+            return await demo(log=demo_logger)
+        finally:
+            demo_logger.removeHandler(handler)
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
+    return wrapper
+
+
+@buffered_output
+async def demo_semantic_entropy(log=logger):
     """
     Demo 1: Semantic Entropy for Hallucination Detection
     
     Reference: Wang et al., Nature 2024
     AUROC >= 0.78
     """
-    print("\n" + "="*70)
-    print("DEMO 1: Semantic Entropy Hallucination Detection")
-    print("="*70)
+    log.info("\n" + "="*70)
+    log.info("DEMO 1: Semantic Entropy Hallucination Detection")
+    log.info("="*70)
     
     calculator = SemanticEntropyCalculator()
     
     # Case 1: Consistent outputs (high confidence)
-    print("\n[CASE 1] Consistent Model Outputs")
-    print("-" * 70)
+    log.info("\n[CASE 1] Consistent Model Outputs")
+    log.info("-" * 70)
     
     consistent = [
         "The Eiffel Tower is a wrought iron lattice tower in Paris, France.",
@@ -55,19 +88,19 @@ def demo_semantic_entropy():
     ]
     
     for i, output in enumerate(consistent, 1):
-        print(f"  Output {i}: {output[:60]}...")
+        log.info("  Output %s: %s...", i, output[:60])
     
     result = calculator.compute(consistent)
-    print(f"\n  Entropy: {result.entropy_value:.3f}")
-    print(f"  Hallucination Probability: {result.hallucination_probability:.1%}")
-    print(f"  Confidence Score: {result.confidence_score:.1%}")
-    print(f"  Status: {'HALLUCINATION' if result.is_hallucination else 'CONFIDENT'}")
+    log.info("\n  Entropy: %.3f", result.entropy_value)
+    log.info("  Hallucination Probability: %.1f%%", result.hallucination_probability * 100)
+    log.info("  Confidence Score: %.1f%%", result.confidence_score * 100)
+    log.info("  Status: %s", 'HALLUCINATION' if result.is_hallucination else 'CONFIDENT')
     assert not result.is_hallucination
-    print(f"  ✅ Result: HIGH CONFIDENCE (outputs consistent)")
+    log.info("  ✅ Result: HIGH CONFIDENCE (outputs consistent)")
     
     # Case 2: Diverse outputs (low confidence)
-    print("\n[CASE 2] Diverse Model Outputs")
-    print("-" * 70)
+    log.info("\n[CASE 2] Diverse Model Outputs")
+    log.info("-" * 70)
     
     diverse = [
         "The capital of France is Paris.",
@@ -78,63 +111,65 @@ def demo_semantic_entropy():
     ]
     
     for i, output in enumerate(diverse, 1):
-        print(f"  Output {i}: {output}")
+        log.info("  Output %s: %s", i, output)
     
     result = calculator.compute(diverse)
-    print(f"\n  Entropy: {result.entropy_value:.3f}")
-    print(f"  Hallucination Probability: {result.hallucination_probability:.1%}")
-    print(f"  Confidence Score: {result.confidence_score:.1%}")
-    print(f"  Status: {'HALLUCINATION' if result.is_hallucination else 'UNCERTAIN'}")
+    log.info("\n  Entropy: %.3f", result.entropy_value)
+    log.info("  Hallucination Probability: %.1f%%", result.hallucination_probability * 100)
+    log.info("  Confidence Score: %.1f%%", result.confidence_score * 100)
+    log.info("  Status: %s", 'HALLUCINATION' if result.is_hallucination else 'UNCERTAIN')
     assert result.entropy_value > 0.5
-    print(f"  ✅ Result: LOW CONFIDENCE (outputs diverse - possible hallucination)")
+    log.info("  ✅ Result: LOW CONFIDENCE (outputs diverse - possible hallucination)")
 
 
-def demo_uncertainty_quantifier():
+@buffered_output
+async def demo_uncertainty_quantifier(log=logger):
     """
     Demo 2: Unified Uncertainty Quantification
     
     Different methods for computing uncertainty
     """
-    print("\n" + "="*70)
-    print("DEMO 2: Uncertainty Quantification Methods")
-    print("="*70)
+    log.info("\n" + "="*70)
+    log.info("DEMO 2: Uncertainty Quantification Methods")
+    log.info("="*70)
     
     quantifier = UncertaintyQuantifier()
     
     # Method 1: Semantic Entropy
-    print("\n[METHOD 1] Semantic Entropy")
-    print("-" * 70)
+    log.info("\n[METHOD 1] Semantic Entropy")
+    log.info("-" * 70)
     texts = ["Output A"] * 5
     estimate = quantifier.from_semantic_entropy(texts)
-    print(f"  Uncertainty: {estimate.uncertainty_value:.2f}")
-    print(f"  Confidence: {estimate.confidence_value:.2f}")
-    print(f"  Interpretation: {estimate.interpretation}")
+    log.info("  Uncertainty: %.2f", estimate.uncertainty_value)
+    log.info("  Confidence: %.2f", estimate.confidence_value)
+    log.info("  Interpretation: %s", estimate.interpretation)
     
     # Method 2: Confidence Score
-    print("\n[METHOD 2] Confidence Score")
-    print("-" * 70)
+    log.info("\n[METHOD 2] Confidence Score")
+    log.info("-" * 70)
     estimate = quantifier.from_confidence_score(0.85)
-    print(f"  Uncertainty: {estimate.uncertainty_value:.2f}")
-    print(f"  Confidence: {estimate.confidence_value:.2f}")
-    print(f"  Interpretation: {estimate.interpretation}")
+    log.info("  Uncertainty: %.2f", estimate.uncertainty_value)
+    log.info("  Confidence: %.2f", estimate.confidence_value)
+    log.info("  Interpretation: %s", estimate.interpretation)
     
     # Method 3: Token Length Heuristic
-    print("\n[METHOD 3] Token Length Heuristic")
-    print("-" * 70)
+    log.info("\n[METHOD 3] Token Length Heuristic")
+    log.info("-" * 70)
     for tokens in [20, 50, 100]:
         estimate = quantifier.from_token_length(tokens)
-        print(f"  Tokens: {tokens:3d} → Uncertainty: {estimate.uncertainty_value:.2f}")
+        log.info("  Tokens: %3d → Uncertainty: %.2f", tokens, estimate.uncertainty_value)
 
 
-def demo_orchestration_pipeline():
+@buffered_output
+async def demo_orchestration_pipeline(log=logger):
     """
     Demo 3: Full Orchestration Pipeline
     
     Routes claims through all 5 gates with reasoning path
     """
-    print("\n" + "="*70)
-    print("DEMO 3: Orchestration Pipeline (All 5 Gates)")
-    print("="*70)
+    log.info("\n" + "="*70)
+    log.info("DEMO 3: Orchestration Pipeline (All 5 Gates)")
+    log.info("="*70)
     
     orchestrator = PrometheusOrchestrator()
     
@@ -149,7 +184,7 @@ def demo_orchestration_pipeline():
                 evidence_hash="bd24c2aaef2ef37ae95f0f9e5f7d9e7c"
             )
         ],
-        uncertainty=Uncertainty(
+        uncertainty=make_uncertainty(
             method=UncertaintyMethod.SEMANTIC_ENTROPY,
             value=0.15,
             interpretation="Multiple papers confirm semantic entropy effectiveness",
@@ -164,43 +199,47 @@ def demo_orchestration_pipeline():
         reason="H001: Validate semantic entropy for hallucination detection"
     )
     
-    print(f"\n[INPUT]")
-    print(f"  Origin Agent: {bundle.origin_agent}")
-    print(f"  Claim: {claim.statement[:60]}...")
-    print(f"  Evidence Source: {claim.evidence_pointers[0].source}")
-    print(f"  Evidence Confidence: {claim.evidence_pointers[0].source_confidence:.0%}")
-    print(f"  Uncertainty (Semantic Entropy): {claim.uncertainty.value:.2f}")
+    # Diagnostics live in __debug__ blocks: `python -O` compiles them out
+    # for clean timing runs (note -O also strips the demo asserts)
+    if __debug__:
+        log.info("\n[INPUT]")
+        log.info("  Origin Agent: %s", bundle.origin_agent)
+        log.info("  Claim: %s...", claim.statement[:60])
+        log.info("  Evidence Source: %s", claim.evidence_pointers[0].source)
+        log.info("  Evidence Confidence: %.0f%%", claim.evidence_pointers[0].source_confidence * 100)
+        log.info("  Uncertainty (Semantic Entropy): %.2f", claim.uncertainty.value)
+        log.info("\n[ORCHESTRATION]")
     
     # Route through orchestrator
-    print(f"\n[ORCHESTRATION]")
-    state = orchestrator.orchestrate(bundle)
-    
-    print(f"  Pipeline Phase: {state.current_phase.value}")
-    print(f"  Final Decision: {state.final_decision.value}")
-    print(f"\n  Gate Sequence:")
-    
-    for i, gate_entry in enumerate(state.reasoning_path, 1):
-        status = "✅" if gate_entry["passed"] else "❌"
-        print(f"    {i}. {status} {gate_entry['gate']:25s} → {gate_entry['decision']}")
-    
-    print(f"\n[OUTPUT]")
-    print(f"  Final Decision: {state.final_decision.value}")
-    print(f"  Reasoning Path Length: {len(state.reasoning_path)} gates")
-    print(f"  Time Elapsed: {(state.timestamp_completed - state.timestamp_created).total_seconds():.3f}s")
+    state = await orchestrator.aorchestrate(bundle)
+    
+    if __debug__:
+        log.info("  Pipeline Phase: %s", state.current_phase.value)
+        log.info("  Final Decision: %s", state.final_decision.value)
+        log.info("\n  Gate Sequence:")
+        for i, gate_entry in enumerate(state.reasoning_path, 1):
+            status = "✅" if gate_entry["passed"] else "❌"
+            log.info("    %s. %s %-25s → %s", i, status, gate_entry['gate'], gate_entry['decision'])
+        
+        log.info("\n[OUTPUT]")
+        log.info("  Final Decision: %s", state.final_decision.value)
+        log.info("  Reasoning Path Length: %s gates", len(state.reasoning_path))
+    log.info("  Time Elapsed: %.3fs", state.elapsed_ms / 1000)
     
     assert state.final_decision == BundleDecision.PUBLISH
-    print(f"\n  ✅ Claim successfully published through gate pipeline")
+    log.info("\n  ✅ Claim successfully published through gate pipeline")
 
 
-def demo_failure_case():
+@buffered_output
+async def demo_failure_case(log=logger):
     """
     Demo 4: Failure Case - High Uncertainty
     
     Shows how DEFER decision works
     """
-    print("\n" + "="*70)
-    print("DEMO 4: High Uncertainty → DEFER Decision")
-    print("="*70)
+    log.info("\n" + "="*70)
+    log.info("DEMO 4: High Uncertainty → DEFER Decision")
+    log.info("="*70)
     
     orchestrator = PrometheusOrchestrator()
     
@@ -209,7 +248,7 @@ def demo_failure_case():
         statement="AI will achieve AGI by 2027",
         claim_type=ClaimType.INFERENCE,
         evidence_pointers=[],
-        uncertainty=Uncertainty(
+        uncertainty=make_uncertainty(
             method=UncertaintyMethod.CONFIDENCE_SCORE,
             value=0.85  # High uncertainty (> 0.75 threshold)
         ),
@@ -222,35 +261,38 @@ def demo_failure_case():
         reason="Test high uncertainty handling"
     )
     
-    print(f"\n[INPUT]")
-    print(f"  Claim: {claim.statement}")
-    print(f"  Claim Type: {claim.claim_type.value}")
-    print(f"  Uncertainty Value: {claim.uncertainty.value:.2f}")
+    if __debug__:
+        log.info("\n[INPUT]")
+        log.info("  Claim: %s", claim.statement)
+        log.info("  Claim Type: %s", claim.claim_type.value)
+        log.info("  Uncertainty Value: %.2f", claim.uncertainty.value)
     
-    state = orchestrator.orchestrate(bundle)
+    state = await orchestrator.aorchestrate(bundle)
     
-    print(f"\n[ORCHESTRATION]")
-    for gate_entry in state.reasoning_path:
-        status = "✅" if gate_entry["passed"] else "❌"
-        print(f"  {status} {gate_entry['gate']:25s} → {gate_entry['decision']}")
+    if __debug__:
+        log.info("\n[ORCHESTRATION]")
+        for gate_entry in state.reasoning_path:
+            status = "✅" if gate_entry["passed"] else "❌"
+            log.info("  %s %-25s → %s", status, gate_entry['gate'], gate_entry['decision'])
     
-    print(f"\n[OUTPUT]")
-    print(f"  Final Decision: {state.final_decision.value}")
-    print(f"  Reason: High uncertainty (0.85) exceeds threshold (0.75)")
+    log.info("\n[OUTPUT]")
+    log.info("  Final Decision: %s", state.final_decision.value)
+    log.info("  Reason: High uncertainty (0.85) exceeds threshold (0.75)")
     
     assert state.final_decision == BundleDecision.DEFER
-    print(f"\n  ✅ High uncertainty correctly deferred for human review")
+    log.info("\n  ✅ High uncertainty correctly deferred for human review")
 
 
-def demo_multi_claim_bundle():
+@buffered_output
+async def demo_multi_claim_bundle(log=logger):
     """
     Demo 5: Multi-Claim Bundle
     
     Bundle with multiple claims processed together
     """
-    print("\n" + "="*70)
-    print("DEMO 5: Multi-Claim Bundle")
-    print("="*70)
+    log.info("\n" + "="*70)
+    log.info("DEMO 5: Multi-Claim Bundle")
+    log.info("="*70)
     
     claims = [
         Claim(
@@ -263,7 +305,7 @@ def demo_multi_claim_bundle():
                     evidence_hash="bd24c2aa"
                 )
             ],
-            uncertainty=Uncertainty(
+            uncertainty=make_uncertainty(
                 method=UncertaintyMethod.SEMANTIC_ENTROPY,
                 value=0.15
             ),
@@ -273,7 +315,7 @@ def demo_multi_claim_bundle():
             statement="Therefore, we can use SE as a safety gate",
             claim_type=ClaimType.INFERENCE,
             evidence_pointers=[],
-            uncertainty=Uncertainty(
+            uncertainty=make_uncertainty(
                 method=UncertaintyMethod.CONFIDENCE_SCORE,
                 value=0.65
             ),
@@ -283,7 +325,7 @@ def demo_multi_claim_bundle():
             statement="Implementation requires multi-model sampling",
             claim_type=ClaimType.DECISION,
             evidence_pointers=[],
-            uncertainty=Uncertainty(
+            uncertainty=make_uncertainty(
                 method=UncertaintyMethod.CONFIDENCE_SCORE,
                 value=0.55
             ),
@@ -297,32 +339,41 @@ def demo_multi_claim_bundle():
         reason="Design semantic entropy safety gate"
     )
     
-    print(f"\n[BUNDLE]")
-    print(f"  Bundle ID: {bundle.id}")
-    print(f"  Claims: {len(claims)}")
-    for i, claim in enumerate(claims, 1):
-        print(f"    {i}. {claim.claim_type.value:10s}: {claim.statement[:50]}...")
+    if __debug__:
+        log.info("\n[BUNDLE]")
+        log.info("  Bundle ID: %s", bundle.id)
+        log.info("  Claims: %s", len(claims))
+        for i, claim in enumerate(claims, 1):
+            log.info("    %s. %-10s: %s...", i, claim.claim_type.value, claim.statement[:50])
     
     orchestrator = PrometheusOrchestrator()
-    state = orchestrator.orchestrate(bundle)
+    state = await orchestrator.aorchestrate(bundle)
     
-    print(f"\n[RESULT]")
-    print(f"  Final Decision: {state.final_decision.value}")
-    print(f"  Gates Passed: {len([g for g in state.reasoning_path if g['passed']])} / 5")
-    print(f"  ✅ Multi-claim bundle processed successfully")
+    log.info("\n[RESULT]")
+    log.info("  Final Decision: %s", state.final_decision.value)
+    log.info("  Gates Passed: %s / 5", len([g for g in state.reasoning_path if g['passed']]))
+    log.info("  ✅ Multi-claim bundle processed successfully")
+
+
+async def run_demos():
+    """Run all demos concurrently; total latency is bounded by the slowest."""
+    await asyncio.gather(
+        demo_semantic_entropy(),
+        demo_uncertainty_quantifier(),
+        demo_orchestration_pipeline(),
+        demo_failure_case(),
+        demo_multi_claim_bundle(),
+    )
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("\n" + "#"*70)
     print("# PROMETHEUS PHASE 2: ORCHESTRATION + SEMANTIC ENTROPY")
     print("#"*70)
     
     try:
-        demo_semantic_entropy()
-        demo_uncertainty_quantifier()
-        demo_orchestration_pipeline()
-        demo_failure_case()
-        demo_multi_claim_bundle()
+        asyncio.run(run_demos())
         
         print("\n" + "="*70)
         print("✅ ALL PHASE 2 DEMOS PASSED")
@@ -1,65 +1,171 @@
 """Audit Log: Immutable, append-only event logging."""
 
-import json
-from typing import Dict, List
-from datetime import datetime
-from uuid import uuid4
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+import copy
 import hashlib
+import sys
+
+import orjson
+
+from src.claim_bundle import new_id, utcnow_iso
+
+# Bound once: OpenSSL picks its SHA-NI/AVX2 code path at runtime, so the only
+# per-call overhead left to trim is the attribute lookup on the module.
+_sha256 = hashlib.sha256
+_CANONICAL = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+_EXPORT = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+_GENESIS = b"\x00" * 32
 
 
 class AuditLog:
-    """Append-only audit log for forensic reconstruction."""
+    """Append-only audit log for forensic reconstruction.
+
+    log_event serializes the payload once to reject unserializable details
+    at the call site, then records a deep copy, so the stored details keep
+    their original types and later edits to the caller's dict are not
+    recorded. Hashing and indexing happen in batches on flush(),
+    which every read calls first. Each event_hash chains over the previous
+    one, so verify_immutability() can detect edits, reordering and
+    truncation.
+    """
+
+    # Pending events that trigger an automatic flush (bounds the queue)
+    FLUSH_THRESHOLD = 1024
 
     def __init__(self):
-        self.events = []
+        self._events: List[Dict] = []
+        # (timestamp, trace_id, event_type, agent_id, copy of details)
+        self._pending: List[Tuple[str, str, str, str, Dict]] = []
+        # Running hash-chain head; each event_hash links to the one before it
+        self._chain_head = _GENESIS
+        # Secondary indexes over self.events (same dict objects, log order)
+        self._by_trace: Dict[str, Dict] = {}
+        self._by_agent: Dict[str, List[Dict]] = defaultdict(list)
+        self._by_type: Dict[str, List[Dict]] = defaultdict(list)
+        # Pretty-printed export body, one ",\n"-terminated entry per event
+        self._json_buf = bytearray()
 
     def log_event(self, event_type: str, agent_id: str, details: Dict) -> str:
         """
         Log an event and return trace_id.
         """
-        trace_id = str(uuid4())
-        event = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "trace_id": trace_id,
-            "event_type": event_type,
-            "agent_id": agent_id,
-            "details": details,
-            "event_hash": self._compute_hash(details)
-        }
-        self.events.append(event)
+        orjson.dumps(details, option=_CANONICAL)  # Raises here on bad payloads
+        snapshot = copy.deepcopy(details)
+        trace_id = new_id()
+        # Few distinct agents/types repeat across many events: share one copy
+        self._pending.append(
+            (utcnow_iso(), trace_id, sys.intern(event_type), sys.intern(agent_id), snapshot)
+        )
+        if len(self._pending) >= self.FLUSH_THRESHOLD:
+            self.flush()
         return trace_id
 
+    def log_events_batch(self, events: List[Tuple[str, str, Dict]]) -> List[str]:
+        """
+        Log a burst of (event_type, agent_id, details) events; return their trace_ids.
+
+        The burst shares one timestamp. Every payload is snapshotted before
+        any is queued, so a bad one rejects the whole burst.
+        """
+        for _, _, details in events:
+            orjson.dumps(details, option=_CANONICAL)
+        snapshots = [copy.deepcopy(details) for _, _, details in events]
+        timestamp = utcnow_iso()
+        trace_ids = [new_id() for _ in events]
+        self._pending.extend(
+            (timestamp, trace_id, sys.intern(event_type), sys.intern(agent_id), snapshot)
+            for trace_id, (event_type, agent_id, _), snapshot in zip(trace_ids, events, snapshots)
+        )
+        if len(self._pending) >= self.FLUSH_THRESHOLD:
+            self.flush()
+        return trace_ids
+
+    def flush(self) -> None:
+        """Chain-hash and index all pending events, in log order."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        for timestamp, trace_id, event_type, agent_id, snapshot in pending:
+            event = {
+                "timestamp": timestamp,
+                "trace_id": trace_id,
+                "event_type": event_type,
+                "agent_id": agent_id,
+                # Detached copy of exactly what was captured at log time
+                "details": snapshot,
+            }
+            # Head advances per event, so the chain always matches self._events
+            head = self._chain_hash(self._chain_head, event)
+            event["event_hash"] = head.hex()
+            self._append(event)
+            self._chain_head = head
+
+    @property
+    def events(self) -> List[Dict]:
+        """All events in log order."""
+        self.flush()
+        return self._events
+
+    def _append(self, event: Dict) -> None:
+        """Append an event and update the secondary indexes."""
+        self._events.append(event)
+        self._by_trace[event["trace_id"]] = event
+        self._by_agent[event["agent_id"]].append(event)
+        self._by_type[event["event_type"]].append(event)
+        # Indent each event one level so the entries nest inside the export array
+        self._json_buf += b"  " + orjson.dumps(event, option=_EXPORT).replace(b"\n", b"\n  ") + b",\n"
+
     def get_events(self, agent_id: str = None, event_type: str = None) -> List[Dict]:
         """
         Query events by agent_id and/or event_type.
         """
-        results = self.events
-        if agent_id:
-            results = [e for e in results if e["agent_id"] == agent_id]
-        if event_type:
-            results = [e for e in results if e["event_type"] == event_type]
-        return results
-
-    def get_trace(self, trace_id: str) -> Dict:
+        self.flush()
+        if not agent_id and not event_type:
+            return self._events
+        # .get() so queries for unknown keys don't grow the defaultdicts
+        if not event_type:
+            return list(self._by_agent.get(agent_id, ()))
+        if not agent_id:
+            return list(self._by_type.get(event_type, ()))
+        by_agent = self._by_agent.get(agent_id, ())
+        by_type = self._by_type.get(event_type, ())
+        if len(by_agent) <= len(by_type):
+            return [e for e in by_agent if e["event_type"] == event_type]
+        return [e for e in by_type if e["agent_id"] == agent_id]
+
+    def get_trace(self, trace_id: str) -> Optional[Dict]:
         """
         Get full execution trace by trace_id.
         """
-        for event in self.events:
-            if event["trace_id"] == trace_id:
-                return event
-        return None
+        self.flush()
+        return self._by_trace.get(trace_id)
 
     def verify_immutability(self) -> bool:
         """
-        Verify that audit log hasn't been tampered (stub).
-        In production: use blockchain or similar.
+        Verify that audit log hasn't been tampered with.
+
+        Replays the hash chain from the genesis head: any edited, dropped,
+        inserted or reordered event breaks a link, and a truncated tail
+        no longer ends at the recorded chain head.
         """
-        return True
+        self.flush()
+        head = _GENESIS
+        for event in self._events:
+            body = {k: v for k, v in event.items() if k != "event_hash"}
+            head = self._chain_hash(head, body)
+            if event.get("event_hash") != head.hex():
+                return False
+        return head == self._chain_head
 
     @staticmethod
-    def _compute_hash(data: Dict) -> str:
-        return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+    def _chain_hash(prev: bytes, event: Dict) -> bytes:
+        # h_i = SHA256(h_{i-1} || canonical(event_i)); canonical = sorted keys, compact UTF-8
+        return _sha256(prev + orjson.dumps(event, option=_CANONICAL)).digest()
 
     def export_json(self) -> str:
         """Export full audit log as JSON."""
-        return json.dumps(self.events, indent=2)
+        self.flush()
+        if not self._json_buf:
+            return "[]"
+        return "[\n" + self._json_buf[:-2].decode() + "\n]"
@@ -7,14 +7,19 @@ This module implements the core data structures and serialization logic.
 Reference: docs/CONTRACTS.md
 """
 
-from dataclasses import dataclass, asdict, field
-from datetime import datetime
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from collections import deque
+from typing import List, Optional, Dict, Any, NamedTuple, Tuple
 import json
-import uuid
+import os
+import sys
+import time
 from hashlib import sha256
 
+import orjson
+
 
 class ClaimType(str, Enum):
     """Types of claims in a bundle."""
@@ -29,6 +34,7 @@ class UncertaintyMethod(str, Enum):
     MODEL_DISAGREEMENT = "model_disagreement"
     CONFIDENCE_SCORE = "confidence_score"
     CONFORMAL_SET = "conformal_set"
+    TOKEN_LENGTH = "token_length"
 
 
 class GateRecommendation(str, Enum):
@@ -40,13 +46,35 @@ class GateRecommendation(str, Enum):
 
 
 class RiskTier(str, Enum):
-    """Risk tiers for actions."""
+    """Risk tiers for actions, ordered by privilege level (not alphabetically)."""
     READ_ONLY = "READ_ONLY"
     WRITE_LIMITED = "WRITE_LIMITED"
     MODIFY = "MODIFY"
     DELETE = "DELETE"
     PRIVILEGE = "PRIVILEGE"
 
+    # Tier-vs-tier comparisons use .level so max()/sorted() follow privilege;
+    # comparisons with plain strings keep str semantics.
+    def __lt__(self, other):
+        if isinstance(other, RiskTier):
+            return self.level < other.level
+        return str.__lt__(self, other)
+
+    def __le__(self, other):
+        if isinstance(other, RiskTier):
+            return self.level <= other.level
+        return str.__le__(self, other)
+
+    def __gt__(self, other):
+        if isinstance(other, RiskTier):
+            return self.level > other.level
+        return str.__gt__(self, other)
+
+    def __ge__(self, other):
+        if isinstance(other, RiskTier):
+            return self.level >= other.level
+        return str.__ge__(self, other)
+
 
 class BundleDecision(str, Enum):
     """Final bundle decision."""
@@ -56,17 +84,89 @@ class BundleDecision(str, Enum):
     REFUSE = "REFUSE"
 
 
-@dataclass
+# Value -> member tables for __post_init__ coercion (skips Enum.__call__)
+_CLAIM_TYPES = {m.value: m for m in ClaimType}
+_UNCERTAINTY_METHODS = {m.value: m for m in UncertaintyMethod}
+_GATE_RECOMMENDATIONS = {m.value: m for m in GateRecommendation}
+_RISK_TIERS = {m.value: m for m in RiskTier}
+_BUNDLE_DECISIONS = {m.value: m for m in BundleDecision}
+
+
+# Privilege level on each tier member (declaration order: READ_ONLY=0 .. PRIVILEGE=4)
+for _level, _tier in enumerate(RiskTier):
+    _tier.level = _level
+del _level, _tier
+
+
+class GateStats(NamedTuple):
+    """Claim aggregates read by the gates, gathered in a single pass."""
+    max_uncertainty: float
+    max_tier: RiskTier
+    max_tier_value: int
+    # (claim id, best source confidence or None if no evidence) per FACT claim, in order
+    fact_evidence: Tuple[Tuple[str, Optional[float]], ...]
+    # Lowest of those confidences: 1.0 with no FACT claims, -1.0 if one has no evidence
+    min_fact_confidence: float = 1.0
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the last timestamp formatted
+_ts_prefix = (-1, "")
+
+
+def utcnow_iso() -> str:
+    """Current UTC time as ISO-8601 with microseconds and a trailing 'Z'.
+
+    The date/time prefix is formatted once per second; objects minted
+    within the same second only format the microsecond tail.
+    """
+    global _ts_prefix
+    sec, usec = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_sec, prefix = _ts_prefix
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _ts_prefix = (sec, prefix)
+    return f"{prefix}.{usec:06d}Z"
+
+
+# Pre-drawn IDs: one os.urandom() call per _ID_BATCH claims/bundles/events
+_ID_BATCH = 1024
+_id_pool: deque = deque()
+
+
+def new_id() -> str:
+    """Return a random UUID4 string drawn from a batched entropy buffer."""
+    if not _id_pool:
+        buf = bytearray(os.urandom(16 * _ID_BATCH))
+        # Stamp version 4 and the RFC 4122 variant into every 16-byte chunk
+        buf[6::16] = bytes((b & 0x0F) | 0x40 for b in buf[6::16])
+        buf[8::16] = bytes((b & 0x3F) | 0x80 for b in buf[8::16])
+        h = buf.hex()
+        _id_pool.extend(
+            f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+            for i in range(0, len(h), 32)
+        )
+    return _id_pool.popleft()
+
+
+# A forked child inherits the parent's pool; drop it so the child draws fresh IDs
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_id_pool.clear)
+
+
+@dataclass(frozen=True, slots=True)
 class EvidencePointer:
-    """Pointer to evidence source for a claim."""
+    """Pointer to evidence source for a claim (immutable, hashable)."""
     source: str
     source_confidence: float
     evidence_hash: str
     retrieved_at: Optional[str] = None
 
     def __post_init__(self):
+        # Many pointers cite the same source URL (often rebuilt from JSON);
+        # interning shares one string and makes equal sources identity-equal
+        object.__setattr__(self, "source", sys.intern(self.source))
         if self.retrieved_at is None:
-            self.retrieved_at = datetime.utcnow().isoformat() + "Z"
+            object.__setattr__(self, "retrieved_at", utcnow_iso())
         if not (0.0 <= self.source_confidence <= 1.0):
             raise ValueError(f"source_confidence must be in [0.0, 1.0], got {self.source_confidence}")
 
@@ -75,12 +175,17 @@ class EvidencePointer:
         return cls(**d)
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "source": self.source,
+            "source_confidence": self.source_confidence,
+            "evidence_hash": self.evidence_hash,
+            "retrieved_at": self.retrieved_at
+        }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Uncertainty:
-    """Uncertainty quantification for a claim."""
+    """Uncertainty quantification for a claim (immutable, hashable)."""
     method: UncertaintyMethod
     value: float
     interpretation: str = ""
@@ -89,40 +194,61 @@ class Uncertainty:
     def __post_init__(self):
         if not (0.0 <= self.value <= 1.0):
             raise ValueError(f"value must be in [0.0, 1.0], got {self.value}")
-        if isinstance(self.method, str):
-            self.method = UncertaintyMethod(self.method)
-        if isinstance(self.gate_recommendation, str):
-            self.gate_recommendation = GateRecommendation(self.gate_recommendation)
+        # Unknown strings still fall through to the Enum constructor for its ValueError
+        if type(self.method) is str:
+            object.__setattr__(self, "method",
+                               _UNCERTAINTY_METHODS.get(self.method) or UncertaintyMethod(self.method))
+        if type(self.gate_recommendation) is str:
+            object.__setattr__(self, "gate_recommendation",
+                               _GATE_RECOMMENDATIONS.get(self.gate_recommendation)
+                               or GateRecommendation(self.gate_recommendation))
 
     @classmethod
     def from_dict(cls, d: Dict[str, Any]) -> "Uncertainty":
         return cls(**d)
 
     def to_dict(self) -> Dict[str, Any]:
+        # _value_ is the plain str stored on the member; .value is a descriptor call
         return {
-            "method": self.method.value,
+            "method": self.method._value_,
             "value": self.value,
             "interpretation": self.interpretation,
-            "gate_recommendation": self.gate_recommendation.value
+            "gate_recommendation": self.gate_recommendation._value_
         }
 
 
-@dataclass
+@lru_cache(maxsize=1024)
+def make_uncertainty(
+    method: UncertaintyMethod,
+    value: float,
+    interpretation: str = "",
+    gate_recommendation: GateRecommendation = GateRecommendation.EXECUTE,
+) -> Uncertainty:
+    """Return a shared Uncertainty for the given fields (safe because it is frozen)."""
+    return Uncertainty(
+        method=method,
+        value=value,
+        interpretation=interpretation,
+        gate_recommendation=gate_recommendation,
+    )
+
+
+@dataclass(slots=True)
 class Claim:
     """Individual claim within a bundle."""
     statement: str
     claim_type: ClaimType
     uncertainty: Uncertainty
     risk_tier: RiskTier
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
     evidence_pointers: List[EvidencePointer] = field(default_factory=list)
     if_wrong_cost: str = ""
 
     def __post_init__(self):
-        if isinstance(self.claim_type, str):
-            self.claim_type = ClaimType(self.claim_type)
-        if isinstance(self.risk_tier, str):
-            self.risk_tier = RiskTier(self.risk_tier)
+        if type(self.claim_type) is str:
+            self.claim_type = _CLAIM_TYPES.get(self.claim_type) or ClaimType(self.claim_type)
+        if type(self.risk_tier) is str:
+            self.risk_tier = _RISK_TIERS.get(self.risk_tier) or RiskTier(self.risk_tier)
         if isinstance(self.uncertainty, dict):
             self.uncertainty = Uncertainty.from_dict(self.uncertainty)
         self.evidence_pointers = [
@@ -138,54 +264,77 @@ class Claim:
         return {
             "id": self.id,
             "statement": self.statement,
-            "claim_type": self.claim_type.value,
+            "claim_type": self.claim_type._value_,
             "evidence_pointers": [ev.to_dict() for ev in self.evidence_pointers],
             "uncertainty": self.uncertainty.to_dict(),
-            "risk_tier": self.risk_tier.value,
+            "risk_tier": self.risk_tier._value_,
             "if_wrong_cost": self.if_wrong_cost
         }
 
+    def max_source_confidence(self) -> Optional[float]:
+        """Best evidence confidence for this claim, or None if it has no evidence."""
+        pointers = self.evidence_pointers
+        if not pointers:
+            return None
+        if len(pointers) == 1:  # Common case: skip the generator
+            return pointers[0].source_confidence
+        return max(ev.source_confidence for ev in pointers)
+
     def validate(self) -> List[str]:
         """Validate claim according to CONTRACTS spec."""
         errors = []
         
         # FACT claims must have evidence
         if self.claim_type == ClaimType.FACT:
-            if not self.evidence_pointers:
+            max_confidence = self.max_source_confidence()
+            if max_confidence is None:
                 errors.append(f"FACT claim '{self.id}' has no evidence_pointers")
             else:
                 # At least one source must have confidence >= 0.60
-                max_confidence = max(ev.source_confidence for ev in self.evidence_pointers)
                 if max_confidence < 0.60:
                     errors.append(f"FACT claim '{self.id}' lacks confident sources (max: {max_confidence:.2f})")
         
         return errors
 
 
-@dataclass
+def _empty_audit_trail() -> Dict[str, List]:
+    """Fresh audit trail; every bundle records gate results, so lists are eager."""
+    return {"gates_passed": [], "gates_failed": [], "human_approvals": []}
+
+
+@dataclass(slots=True)
 class ClaimBundle:
     """Universal contract for PROMETHEUS outputs."""
     origin_agent: str
     claims: List[Claim]
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
+    id: str = field(default_factory=new_id)
+    timestamp: str = field(default_factory=utcnow_iso)
     decision: BundleDecision = BundleDecision.DEFER
     reason: str = ""
     required_approvals: List[str] = field(default_factory=list)
-    audit_trail: Dict[str, Any] = field(default_factory=lambda: {
-        "gates_passed": [],
-        "gates_failed": [],
-        "human_approvals": []
-    })
+    audit_trail: Dict[str, Any] = field(default_factory=_empty_audit_trail)
 
     def __post_init__(self):
-        if isinstance(self.decision, str):
-            self.decision = BundleDecision(self.decision)
+        if type(self.decision) is str:
+            self.decision = _BUNDLE_DECISIONS.get(self.decision) or BundleDecision(self.decision)
         self.claims = [
             claim if isinstance(claim, Claim) else Claim.from_dict(claim)
             for claim in self.claims
         ]
 
+    def reset(self, claims: List[Claim], origin_agent: Optional[str] = None):
+        """Reuse this bundle for a new set of claims (fresh id, timestamp and audit trail)."""
+        self.id = new_id()
+        self.timestamp = utcnow_iso()
+        if origin_agent is not None:
+            self.origin_agent = origin_agent
+        self.claims = claims
+        self.decision = BundleDecision.DEFER
+        self.reason = ""
+        self.required_approvals = []
+        self.audit_trail = _empty_audit_trail()
+        self.__post_init__()
+
     @classmethod
     def from_dict(cls, d: Dict[str, Any]) -> "ClaimBundle":
         return cls(**d)
@@ -196,29 +345,41 @@ class ClaimBundle:
             "timestamp": self.timestamp,
             "origin_agent": self.origin_agent,
             "claims": [claim.to_dict() for claim in self.claims],
-            "decision": self.decision.value,
+            "decision": self.decision._value_,
             "reason": self.reason,
             "required_approvals": self.required_approvals,
             "audit_trail": self.audit_trail
         }
 
-    def to_json(self, indent: int = 2) -> str:
-        """Serialize bundle to JSON."""
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Serialize bundle to JSON.
+
+        orjson handles the 2-space default and compact (indent=None) output;
+        other indent widths fall back to the stdlib encoder.
+        """
+        if indent == 2:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode()
+        if indent is None:
+            return orjson.dumps(self.to_dict()).decode()
         return json.dumps(self.to_dict(), indent=indent)
 
     @classmethod
     def from_json(cls, json_str: str) -> "ClaimBundle":
         """Deserialize bundle from JSON."""
-        data = json.loads(json_str)
+        data = orjson.loads(json_str)
         return cls.from_dict(data)
 
     def validate(self) -> List[str]:
         """Validate entire bundle."""
         errors = []
         
-        # Validate all claims
+        # Validate all claims; Claim.validate only has rules for FACT claims,
+        # so the others skip the call (and its empty list) entirely. Same ==
+        # test as Claim.validate, so a reassigned "FACT" string still counts
+        fact = ClaimType.FACT
         for claim in self.claims:
-            errors.extend(claim.validate())
+            if claim.claim_type == fact:
+                errors.extend(claim.validate())
         
         # Validate bundle structure
         if not self.origin_agent:
@@ -228,6 +389,38 @@ class ClaimBundle:
         
         return errors
 
+    def compute_gate_stats(self) -> GateStats:
+        """Aggregate uncertainty, risk tier and FACT evidence over claims in one pass."""
+        max_uncertainty = 0.0
+        max_tier = RiskTier.READ_ONLY
+        max_tier_value = 0
+        fact_evidence = []
+        min_fact_confidence = 1.0
+        # == (str-enum compare), not identity: Claim is mutable, so a plain
+        # "FACT" assigned after construction must still count as FACT
+        fact = ClaimType.FACT
+        for claim in self.claims:
+            value = claim.uncertainty.value
+            if value > max_uncertainty:
+                max_uncertainty = value
+            tier = claim.risk_tier
+            if tier.__class__ is not RiskTier:
+                # A plain string reassigned after construction: resolve it like
+                # the old TIER_HIERARCHY.get(tier, 0) lookup (unknown = level 0)
+                tier = _RISK_TIERS.get(tier, RiskTier.READ_ONLY)
+            if tier.level > max_tier_value:
+                max_tier, max_tier_value = tier, tier.level
+            if claim.claim_type == fact:
+                confidence = claim.max_source_confidence()
+                fact_evidence.append((claim.id, confidence))
+                if confidence is None:
+                    min_fact_confidence = -1.0
+                elif confidence < min_fact_confidence:
+                    min_fact_confidence = confidence
+        return GateStats(
+            max_uncertainty, max_tier, max_tier_value, tuple(fact_evidence), min_fact_confidence
+        )
+
     def add_gate_result(self, gate_name: str, passed: bool):
         """Record gate result in audit trail."""
         if passed:
@@ -239,7 +432,7 @@ class ClaimBundle:
         """Record human approval in audit trail."""
         approval = {
             "approver": approver,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": utcnow_iso(),
             "decision": decision,
             "reason": reason
         }
@@ -12,20 +12,21 @@ Reference: docs/GATES.md
 """
 
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Protocol, Type
 from enum import Enum
 
 from src.claim_bundle import (
     ClaimBundle,
     ClaimType,
     BundleDecision,
+    GateStats,
     RiskTier,
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GateResult:
-    """Result of a gate evaluation."""
+    """Result of a gate evaluation (immutable, so fixed outcomes are shared)."""
     gate_name: str
     passed: bool
     decision: BundleDecision
@@ -33,47 +34,57 @@ class GateResult:
     escalate_to: Optional[str] = None
 
 
+class Gate(Protocol):
+    """Structural interface shared by every gate class.
+
+    Gates are plain synchronous classmethods: none of them do I/O, so there
+    is no base class or coroutine to allocate per evaluation. Gate-specific
+    parameters (agent_tier, threat_score) are keyword arguments with defaults.
+    """
+
+    @classmethod
+    def evaluate(cls, bundle: ClaimBundle, stats: Optional[GateStats] = None) -> GateResult:
+        ...
+
+
 class EvidenceGate:
     """Gate 1: Verify FACT claims have evidence."""
 
     MIN_CONFIDENCE = 0.60
 
+    _PASS = GateResult(
+        gate_name="Evidence Gate",
+        passed=True,
+        decision=BundleDecision.PUBLISH,
+        reason="All FACT claims have sufficient evidence"
+    )
+
     @classmethod
-    def evaluate(cls, bundle: ClaimBundle) -> GateResult:
+    def evaluate(cls, bundle: ClaimBundle, stats: Optional[GateStats] = None) -> GateResult:
         """Evaluate bundle against evidence requirements."""
-        for claim in bundle.claims:
-            if claim.claim_type != ClaimType.FACT:
-                continue
-
-            # FACT claims must have evidence
-            if not claim.evidence_pointers:
-                return GateResult(
-                    gate_name="Evidence Gate",
-                    passed=False,
-                    decision=BundleDecision.REFUSE,
-                    reason=f"FACT claim '{claim.id}' has no evidence"
-                )
-
-            # At least one source must have confidence >= threshold
-            max_confidence = max(
-                (ev.source_confidence for ev in claim.evidence_pointers),
-                default=0.0
-            )
-
-            if max_confidence < cls.MIN_CONFIDENCE:
-                return GateResult(
-                    gate_name="Evidence Gate",
-                    passed=False,
-                    decision=BundleDecision.DEFER,
-                    reason=f"FACT claim lacks confident sources (max: {max_confidence:.2f}, required: {cls.MIN_CONFIDENCE})"
-                )
-
-        return GateResult(
-            gate_name="Evidence Gate",
-            passed=True,
-            decision=BundleDecision.PUBLISH,
-            reason="All FACT claims have sufficient evidence"
-        )
+        stats = stats or bundle.compute_gate_stats()
+        # Common case: every FACT claim clears the bar, no need to find an offender
+        if stats.min_fact_confidence < cls.MIN_CONFIDENCE:
+            for claim_id, max_confidence in stats.fact_evidence:
+                # FACT claims must have evidence
+                if max_confidence is None:
+                    return GateResult(
+                        gate_name="Evidence Gate",
+                        passed=False,
+                        decision=BundleDecision.REFUSE,
+                        reason=f"FACT claim '{claim_id}' has no evidence"
+                    )
+
+                # At least one source must have confidence >= threshold
+                if max_confidence < cls.MIN_CONFIDENCE:
+                    return GateResult(
+                        gate_name="Evidence Gate",
+                        passed=False,
+                        decision=BundleDecision.DEFER,
+                        reason=f"FACT claim lacks confident sources (max: {max_confidence:.2f}, required: {cls.MIN_CONFIDENCE})"
+                    )
+
+        return cls._PASS
 
 
 class UncertaintyGate:
@@ -83,12 +94,9 @@ class UncertaintyGate:
     EXPLAIN_THRESHOLD = 0.50
 
     @classmethod
-    def evaluate(cls, bundle: ClaimBundle) -> GateResult:
+    def evaluate(cls, bundle: ClaimBundle, stats: Optional[GateStats] = None) -> GateResult:
         """Evaluate bundle against uncertainty thresholds."""
-        max_uncertainty = max(
-            (claim.uncertainty.value for claim in bundle.claims),
-            default=0.0
-        )
+        max_uncertainty = (stats or bundle.compute_gate_stats()).max_uncertainty
 
         if max_uncertainty > cls.DEFER_THRESHOLD:
             return GateResult(
@@ -117,30 +125,27 @@ class UncertaintyGate:
 class SecurityGate:
     """Gate 3: Enforce privilege hierarchy and transport security."""
 
-    TIER_HIERARCHY = {
-        RiskTier.READ_ONLY: 0,
-        RiskTier.WRITE_LIMITED: 1,
-        RiskTier.MODIFY: 2,
-        RiskTier.DELETE: 3,
-        RiskTier.PRIVILEGE: 4,
-    }
+    # READ_ONLY=0 .. PRIVILEGE=4 (reference table; evaluate reads RiskTier.level)
+    TIER_HIERARCHY = {tier: tier.level for tier in RiskTier}
+
+    _PASS = GateResult(
+        gate_name="Security Gate",
+        passed=True,
+        decision=BundleDecision.PUBLISH,
+        reason="Security requirements met"
+    )
 
     @classmethod
     def evaluate(
         cls,
         bundle: ClaimBundle,
         agent_tier: int = 4,  # Default: max tier
-        allow_transport: str = "stdio"
+        allow_transport: str = "stdio",
+        stats: Optional[GateStats] = None
     ) -> GateResult:
         """Evaluate bundle against security requirements."""
-        # Check privilege hierarchy
-        max_tier_value = max(
-            (
-                cls.TIER_HIERARCHY.get(claim.risk_tier, 0)
-                for claim in bundle.claims
-            ),
-            default=0
-        )
+        # Check privilege hierarchy: one int compare against the precomputed level
+        max_tier_value = (stats or bundle.compute_gate_stats()).max_tier_value
 
         if agent_tier < max_tier_value:
             return GateResult(
@@ -156,12 +161,7 @@ class SecurityGate:
             # Stub for now: assume Origin validation passed
             pass
 
-        return GateResult(
-            gate_name="Security Gate",
-            passed=True,
-            decision=BundleDecision.PUBLISH,
-            reason="Security requirements met"
-        )
+        return cls._PASS
 
 
 class AdversarialGate:
@@ -172,14 +172,27 @@ class AdversarialGate:
 
     THREAT_THRESHOLD = 0.70
 
+    _PASS = GateResult(
+        gate_name="Adversarial Gate",
+        passed=True,
+        decision=BundleDecision.PUBLISH,
+        reason="No adversarial patterns detected"
+    )
+
     @classmethod
-    def evaluate(cls, bundle: ClaimBundle, threat_score: float = 0.0) -> GateResult:
+    def evaluate(
+        cls,
+        bundle: ClaimBundle,
+        threat_score: float = 0.0,
+        stats: Optional[GateStats] = None
+    ) -> GateResult:
         """Evaluate bundle for adversarial patterns.
         
         Args:
             bundle: ClaimBundle to evaluate
             threat_score: Pre-computed threat score (0.0-1.0). In production,
                          this would be computed by guardian LLM.
+            stats: Precomputed claim aggregates (unused by the stub)
         """
         if threat_score > cls.THREAT_THRESHOLD:
             return GateResult(
@@ -189,12 +202,7 @@ class AdversarialGate:
                 reason=f"Adversarial pattern detected (threat_score: {threat_score:.2f})"
             )
 
-        return GateResult(
-            gate_name="Adversarial Gate",
-            passed=True,
-            decision=BundleDecision.PUBLISH,
-            reason="No adversarial patterns detected"
-        )
+        return cls._PASS
 
 
 class HumanApprovalGate:
@@ -209,14 +217,22 @@ class HumanApprovalGate:
         RiskTier.PRIVILEGE: (True, "security_team"),
     }
 
+    # One shared pass result per tier
+    _AUTO_APPROVED = {
+        tier: GateResult(
+            gate_name="Human Approval Gate",
+            passed=True,
+            decision=BundleDecision.PUBLISH,
+            reason=f"Auto-approved (tier: {tier.value})"
+        )
+        for tier in RiskTier
+    }
+
     @classmethod
-    def evaluate(cls, bundle: ClaimBundle) -> GateResult:
+    def evaluate(cls, bundle: ClaimBundle, stats: Optional[GateStats] = None) -> GateResult:
         """Evaluate bundle for human approval requirements."""
-        # Find max risk tier
-        max_tier = max(
-            (claim.risk_tier for claim in bundle.claims),
-            default=RiskTier.READ_ONLY
-        )
+        # Find max risk tier (by privilege level, not by enum string value)
+        max_tier = (stats or bundle.compute_gate_stats()).max_tier
 
         requires_approval, escalate_to = cls.APPROVAL_MAP.get(
             max_tier,
@@ -232,18 +248,13 @@ class HumanApprovalGate:
                 escalate_to=escalate_to
             )
 
-        return GateResult(
-            gate_name="Human Approval Gate",
-            passed=True,
-            decision=BundleDecision.PUBLISH,
-            reason=f"Auto-approved (tier: {max_tier.value})"
-        )
+        return cls._AUTO_APPROVED[max_tier]
 
 
 class GateStack:
     """Orchestrate all 5 gates in sequence."""
 
-    GATES = [
+    GATES: List[Type[Gate]] = [
         EvidenceGate,
         UncertaintyGate,
         SecurityGate,
@@ -251,13 +262,20 @@ class GateStack:
         HumanApprovalGate,
     ]
 
+    _ALL_PASSED = GateResult(
+        gate_name="GateStack",
+        passed=True,
+        decision=BundleDecision.PUBLISH,
+        reason="All gates passed"
+    )
+
     @classmethod
     def evaluate(cls, bundle: ClaimBundle) -> GateResult:
-        """Run bundle through all gates."""
+        """Run bundle through all gates, stopping at the first failure."""
+        stats = bundle.compute_gate_stats()
         for gate_class in cls.GATES:
-            result = gate_class.evaluate(bundle)
+            result = gate_class.evaluate(bundle, stats=stats)
             bundle.add_gate_result(result.gate_name, result.passed)
-
             if not result.passed:
                 bundle.decision = result.decision
                 bundle.reason = result.reason
@@ -265,9 +283,4 @@ class GateStack:
 
         # All gates passed
         bundle.decision = BundleDecision.PUBLISH
-        return GateResult(
-            gate_name="GateStack",
-            passed=True,
-            decision=BundleDecision.PUBLISH,
-            reason="All gates passed"
-        )
+        return cls._ALL_PASSED
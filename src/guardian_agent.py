@@ -4,7 +4,7 @@ from typing import Dict, List
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class GuardianEvaluation:
     """Guardian agent evaluation result."""
     threat_score: float  # 0.0-1.0
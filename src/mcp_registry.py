@@ -2,20 +2,31 @@
 
 from typing import Dict, Optional, List
 
+from src.claim_bundle import RiskTier
+
 
 class MCPToolRegistry:
     """Minimal MCP tool registry for managing tools and schemas."""
 
     def __init__(self):
         self.tools = {}
+        # Tool name -> RiskTier.level, resolved once at registration
+        self._tier_levels: Dict[str, int] = {}
 
     def register_tool(self, name: str, schema: Dict, required_tier: str = "READ_ONLY"):
         """Register a tool with JSON schema."""
+        level = RiskTier(required_tier).level  # Rejects unknown tiers up front
         self.tools[name] = {
             "name": name,
             "schema": schema,
             "required_tier": required_tier
         }
+        self._tier_levels[name] = level
+
+    def revoke_tool(self, name: str) -> None:
+        """Remove a tool; later permission checks for it are denied."""
+        self.tools.pop(name, None)
+        self._tier_levels.pop(name, None)
 
     def list_tools(self) -> List[Dict]:
         """List all registered tools."""
@@ -26,6 +37,11 @@ class MCPToolRegistry:
         tool = self.tools.get(name)
         return tool["schema"] if tool else None
 
+    def is_permitted(self, tool_name: str, agent_tier: int) -> bool:
+        """Check an agent's tier (0-4, as in SecurityGate) against the tool's required tier."""
+        level = self._tier_levels.get(tool_name)
+        return level is not None and agent_tier >= level
+
     def validate_arguments(self, tool_name: str, arguments: Dict) -> bool:
         """Minimal argument validation (stub)."""
         if tool_name not in self.tools:
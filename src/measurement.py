@@ -1,7 +1,7 @@
 """Measurement Policy: MMM vs MTA decision tree."""
 
 from enum import Enum
-from typing import Literal
+from typing import Literal, Tuple
 from dataclasses import dataclass
 
 
@@ -13,25 +13,25 @@ class MeasurementApproach(str, Enum):
     RCT_BASED = "rct_based"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MTAPolicy:
     """Multi-Touch Attribution configuration."""
     optimization_frequency: str  # "daily", "weekly"
-    channels: list  # ["facebook", "google", "tiktok"]
+    channels: Tuple[str, ...]  # ("facebook", "google", "tiktok")
     attribution_model: str  # "last_click", "first_click", "linear", "time_decay"
     lookback_window_days: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MMMPolicy:
     """Marketing Mix Modeling configuration."""
     optimization_frequency: str  # "quarterly", "monthly"
-    channels: list  # ["tv", "digital", "influencer"]
+    channels: Tuple[str, ...]  # ("tv", "digital", "influencer")
     data_source: str  # "aggregated_historical"
     modeling_horizon_days: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IncrementalityTestPolicy:
     """Incrementality testing configuration."""
     enabled: bool
@@ -40,7 +40,43 @@ class IncrementalityTestPolicy:
     measure: str  # "true_causal_lift"
 
 
-@dataclass
+# (timeline, has_user_tracking, has_historical_aggregate) -> approach;
+# any other timeline falls back to HYBRID
+_APPROACH_TABLE = {
+    ("short_term", True, True): MeasurementApproach.MTA,
+    ("short_term", True, False): MeasurementApproach.MTA,
+    ("short_term", False, True): MeasurementApproach.HYBRID,
+    ("short_term", False, False): MeasurementApproach.HYBRID,
+    ("long_term", True, True): MeasurementApproach.MMM,
+    ("long_term", False, True): MeasurementApproach.MMM,
+    ("long_term", True, False): MeasurementApproach.RCT_BASED,
+    ("long_term", False, False): MeasurementApproach.RCT_BASED,
+}
+
+# Sub-policies are frozen, so every MeasurementPolicy can share one set
+_DEFAULT_POLICIES = (
+    MTAPolicy(
+        optimization_frequency="daily",
+        channels=("facebook", "google"),
+        attribution_model="last_click",
+        lookback_window_days=7
+    ),
+    MMMPolicy(
+        optimization_frequency="quarterly",
+        channels=("all",),
+        data_source="aggregated_historical",
+        modeling_horizon_days=90
+    ),
+    IncrementalityTestPolicy(
+        enabled=True,
+        holdout_size_percent=10,
+        duration_days=14,
+        measure="true_causal_lift"
+    ),
+)
+
+
+@dataclass(slots=True)
 class MeasurementPolicy:
     """Complete measurement policy."""
     approach: MeasurementApproach
@@ -58,37 +94,8 @@ class MeasurementPolicy:
         """
         Select measurement approach based on data availability.
         """
-        if timeline == "short_term":
-            if has_user_tracking:
-                approach = MeasurementApproach.MTA
-            else:
-                approach = MeasurementApproach.HYBRID
-        elif timeline == "long_term":
-            if has_historical_aggregate:
-                approach = MeasurementApproach.MMM
-            else:
-                approach = MeasurementApproach.RCT_BASED
-        else:
-            approach = MeasurementApproach.HYBRID
-
-        return cls(
-            approach=approach,
-            short_cycle=MTAPolicy(
-                optimization_frequency="daily",
-                channels=["facebook", "google"],
-                attribution_model="last_click",
-                lookback_window_days=7
-            ),
-            long_cycle=MMMPolicy(
-                optimization_frequency="quarterly",
-                channels=["all"],
-                data_source="aggregated_historical",
-                modeling_horizon_days=90
-            ),
-            incrementality_tests=IncrementalityTestPolicy(
-                enabled=True,
-                holdout_size_percent=10,
-                duration_days=14,
-                measure="true_causal_lift"
-            )
+        approach = _APPROACH_TABLE.get(
+            (timeline, bool(has_user_tracking), bool(has_historical_aggregate)),
+            MeasurementApproach.HYBRID
         )
+        return cls(approach, *_DEFAULT_POLICIES)
@@ -12,13 +12,15 @@ Architecture:
   Adversarial Gate → Human Approval Gate → Decision
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from functools import partial
+from typing import Optional, List, Dict, Any, Callable, Deque
 from enum import Enum
-from datetime import datetime
-import uuid
+from datetime import datetime, timedelta
+import time
 
-from src.claim_bundle import ClaimBundle, BundleDecision
+from src.claim_bundle import ClaimBundle, BundleDecision, GateStats, new_id
 from src.gates import (
     GateStack, EvidenceGate, UncertaintyGate, SecurityGate,
     AdversarialGate, HumanApprovalGate, GateResult
@@ -37,7 +39,7 @@ class OrchestratorPhase(str, Enum):
     COMPLETE = "COMPLETE"
 
 
-@dataclass
+@dataclass(slots=True)
 class OrchestratorConfig:
     """
     Configuration for orchestrator behavior.
@@ -50,6 +52,10 @@ class OrchestratorConfig:
         threat_score_threshold: Above this = DEFER for adversarial (0-1)
         enable_human_escalation: Whether to escalate to humans for risky decisions
         audit_log_path: Path to append-only audit log
+        adaptive_gate_order: Periodically move the most often failing gates to
+            the front of the pipeline (changes which failure a bundle reports)
+        history_capacity: Most recent orchestrations kept in memory (>= 1);
+            older states (and the bundles they reference) are released
     """
     max_retries: int = 3
     evidence_confidence_threshold: float = 0.60
@@ -58,9 +64,16 @@ class OrchestratorConfig:
     threat_score_threshold: float = 0.70
     enable_human_escalation: bool = True
     audit_log_path: str = "/var/log/prometheus/audit.log"
+    adaptive_gate_order: bool = False
+    history_capacity: int = 10_000
 
+    def __post_init__(self):
+        # get_reasoning_path looks states up in history, so it must hold at least one
+        if self.history_capacity < 1:
+            raise ValueError(f"history_capacity must be >= 1, got {self.history_capacity}")
 
-@dataclass
+
+@dataclass(slots=True)
 class OrchestratorState:
     """
     State machine for orchestration.
@@ -81,6 +94,17 @@ class OrchestratorState:
     timestamp_completed: Optional[datetime] = None
     error_message: Optional[str] = None
     retry_count: int = 0
+    timestamp_ns_created: int = field(default_factory=time.monotonic_ns)
+    timestamp_ns_completed: Optional[int] = None
+    # monotonic_ns of each reasoning_path entry (same index)
+    _reasoning_ns: List[int] = field(default_factory=list, repr=False)
+    
+    @property
+    def elapsed_ms(self) -> Optional[float]:
+        """Monotonic processing time in milliseconds (None until complete)."""
+        if self.timestamp_ns_completed is None:
+            return None
+        return (self.timestamp_ns_completed - self.timestamp_ns_created) / 1_000_000
     
     def add_gate_evaluation(self, gate_name: str, result: GateResult) -> None:
         """
@@ -96,8 +120,27 @@ class OrchestratorState:
             "passed": result.passed,
             "decision": result.decision.value if result.decision else None,
             "reason": result.reason,
-            "timestamp": datetime.utcnow().isoformat(),
         })
+        self._reasoning_ns.append(time.monotonic_ns())
+    
+    def reasoning_path_serialized(self) -> List[Dict[str, Any]]:
+        """
+        Reasoning path with ISO-8601 (UTC) timestamps for audit output.
+        
+        Evaluations record monotonic nanoseconds internally; they are mapped
+        to wall-clock time here, anchored on timestamp_created /
+        timestamp_ns_created.
+        """
+        anchor, anchor_ns = self.timestamp_created, self.timestamp_ns_created
+        return [
+            {
+                **entry,
+                "timestamp": (
+                    anchor + timedelta(microseconds=(ns - anchor_ns) // 1000)
+                ).isoformat(),
+            }
+            for entry, ns in zip(self.reasoning_path, self._reasoning_ns)
+        ]
     
     def advance_phase(self, new_phase: OrchestratorPhase) -> None:
         """
@@ -117,6 +160,7 @@ class OrchestratorState:
         """
         self.current_phase = OrchestratorPhase.COMPLETE
         self.final_decision = decision
+        self.timestamp_ns_completed = time.monotonic_ns()
         self.timestamp_completed = datetime.utcnow()
 
 
@@ -137,6 +181,24 @@ class PrometheusOrchestrator:
     - Finally produces BundleDecision
     """
     
+    # (phase, gate name, evaluator, decision if the gate raises)
+    GATE_PIPELINE = (
+        (OrchestratorPhase.EVIDENCE_GATE, "Evidence Gate",
+         EvidenceGate.evaluate, BundleDecision.REFUSE),
+        (OrchestratorPhase.UNCERTAINTY_GATE, "Uncertainty Gate",
+         UncertaintyGate.evaluate, BundleDecision.DEFER),
+        (OrchestratorPhase.SECURITY_GATE, "Security Gate",
+         partial(SecurityGate.evaluate, agent_tier=0), BundleDecision.REFUSE),  # Default tier
+        (OrchestratorPhase.ADVERSARIAL_GATE, "Adversarial Gate",
+         partial(AdversarialGate.evaluate, threat_score=0.3), BundleDecision.DEFER),  # Default threat
+        (OrchestratorPhase.HUMAN_APPROVAL_GATE, "Human Approval Gate",
+         HumanApprovalGate.evaluate, BundleDecision.ESCALATE),
+    )
+    
+    # Adaptive ordering: EWMA weight (~last 1000 runs) and runs between reorders
+    FAILURE_RATE_ALPHA = 0.001
+    REORDER_INTERVAL = 1000
+    
     def __init__(self, config: Optional[OrchestratorConfig] = None):
         """
         Initialize orchestrator.
@@ -145,7 +207,15 @@ class PrometheusOrchestrator:
             config: Orchestrator configuration (uses defaults if None)
         """
         self.config = config or OrchestratorConfig()
-        self.execution_history: List[OrchestratorState] = []
+        self.execution_history: Deque[OrchestratorState] = deque(
+            maxlen=self.config.history_capacity
+        )
+        self._by_id: Dict[str, OrchestratorState] = {}
+        self.pipeline = self.GATE_PIPELINE
+        self.gate_failure_rates: Dict[str, float] = {
+            gate_name: 0.0 for _, gate_name, _, _ in self.GATE_PIPELINE
+        }
+        self._runs = 0
     
     def orchestrate(self, bundle: ClaimBundle) -> OrchestratorState:
         """
@@ -162,103 +232,118 @@ class PrometheusOrchestrator:
         """
         # Initialize state
         state = OrchestratorState(
-            bundle_id=str(uuid.uuid4()),
+            bundle_id=new_id(),
             bundle=bundle,
         )
         
-        # Phase 1: Evidence Gate
-        state.advance_phase(OrchestratorPhase.EVIDENCE_GATE)
-        try:
-            evidence_result = EvidenceGate.evaluate(bundle)
-            state.add_gate_evaluation("Evidence Gate", evidence_result)
-            
-            if not evidence_result.passed:
-                state.mark_complete(evidence_result.decision)
-                self.execution_history.append(state)
-                return state
-        except Exception as e:
-            state.error_message = f"Evidence Gate error: {str(e)}"
-            state.mark_complete(BundleDecision.REFUSE)
-            self.execution_history.append(state)
-            return state
-        
-        # Phase 2: Uncertainty Gate
-        state.advance_phase(OrchestratorPhase.UNCERTAINTY_GATE)
+        # Gate-major pipeline over claim aggregates gathered once up front;
+        # on a malformed bundle each gate recomputes and reports its own error
         try:
-            uncertainty_result = UncertaintyGate.evaluate(bundle)
-            state.add_gate_evaluation("Uncertainty Gate", uncertainty_result)
-            
-            if not uncertainty_result.passed:
-                state.mark_complete(uncertainty_result.decision)
-                self.execution_history.append(state)
-                return state
-        except Exception as e:
-            state.error_message = f"Uncertainty Gate error: {str(e)}"
-            state.mark_complete(BundleDecision.DEFER)
-            self.execution_history.append(state)
-            return state
-        
-        # Phase 3: Security Gate
-        state.advance_phase(OrchestratorPhase.SECURITY_GATE)
-        try:
-            security_result = SecurityGate.evaluate(bundle, agent_tier=0)  # Default tier
-            state.add_gate_evaluation("Security Gate", security_result)
-            
-            if not security_result.passed:
-                state.mark_complete(security_result.decision)
-                self.execution_history.append(state)
-                return state
-        except Exception as e:
-            state.error_message = f"Security Gate error: {str(e)}"
-            state.mark_complete(BundleDecision.REFUSE)
-            self.execution_history.append(state)
-            return state
-        
-        # Phase 4: Adversarial Gate
-        state.advance_phase(OrchestratorPhase.ADVERSARIAL_GATE)
-        try:
-            adversarial_result = AdversarialGate.evaluate(bundle, threat_score=0.3)  # Default threat
-            state.add_gate_evaluation("Adversarial Gate", adversarial_result)
-            
-            if not adversarial_result.passed:
-                state.mark_complete(adversarial_result.decision)
-                self.execution_history.append(state)
-                return state
-        except Exception as e:
-            state.error_message = f"Adversarial Gate error: {str(e)}"
-            state.mark_complete(BundleDecision.DEFER)
-            self.execution_history.append(state)
-            return state
-        
-        # Phase 5: Human Approval Gate
-        state.advance_phase(OrchestratorPhase.HUMAN_APPROVAL_GATE)
-        try:
-            human_result = HumanApprovalGate.evaluate(bundle)
-            state.add_gate_evaluation("Human Approval Gate", human_result)
-            
-            if not human_result.passed:
-                state.mark_complete(human_result.decision)
-                self.execution_history.append(state)
-                return state
-        except Exception as e:
-            state.error_message = f"Human Approval Gate error: {str(e)}"
-            state.mark_complete(BundleDecision.ESCALATE)
-            self.execution_history.append(state)
-            return state
+            stats = bundle.compute_gate_stats()
+        except Exception:
+            stats = None
+        if self.config.adaptive_gate_order:
+            self._runs += 1
+            if self._runs % self.REORDER_INTERVAL == 0:
+                self._reorder_pipeline()
+        for phase, gate_name, evaluate, error_decision in self.pipeline:
+            state.advance_phase(phase)
+            decision = self._run_gate(state, bundle, stats, gate_name, evaluate, error_decision)
+            if decision is not None:
+                return self._finish(state, decision)
         
         # All gates passed
         state.advance_phase(OrchestratorPhase.DECISION_MADE)
-        state.mark_complete(BundleDecision.PUBLISH)
         
         # Record in bundle's audit trail
         bundle.decision = BundleDecision.PUBLISH
-        for gate_name in ["Evidence Gate", "Uncertainty Gate", "Security Gate",
-                          "Adversarial Gate", "Human Approval Gate"]:
+        for _, gate_name, _, _ in self.pipeline:
             bundle.add_gate_result(gate_name, True)
         
-        self.execution_history.append(state)
+        return self._finish(state, BundleDecision.PUBLISH)
+    
+    def _run_gate(
+        self,
+        state: OrchestratorState,
+        bundle: ClaimBundle,
+        stats: Optional[GateStats],
+        gate_name: str,
+        evaluate: Callable[..., GateResult],
+        error_decision: BundleDecision,
+    ) -> Optional[BundleDecision]:
+        """
+        Evaluate one gate and record it on the state.
+        
+        Returns:
+            The terminal decision if this gate stops the pipeline, else None
+        """
+        try:
+            result = evaluate(bundle, stats=stats)
+            state.add_gate_evaluation(gate_name, result)
+        except Exception as e:
+            state.error_message = f"{gate_name} error: {str(e)}"
+            return error_decision
+        if self.config.adaptive_gate_order:
+            self._observe_gate(gate_name, result.passed)
+        return None if result.passed else result.decision
+    
+    def _finish(self, state: OrchestratorState, decision: BundleDecision) -> OrchestratorState:
+        """Complete the state with its final decision and record it in history."""
+        state.mark_complete(decision)
+        history = self.execution_history
+        if history and len(history) == history.maxlen:
+            # The append below evicts the oldest state; drop it from the index too
+            del self._by_id[history[0].bundle_id]
+        history.append(state)
+        self._by_id[state.bundle_id] = state
         return state
     
+    def _observe_gate(self, gate_name: str, passed: bool) -> None:
+        """Fold one gate outcome into its exponentially weighted failure rate."""
+        rate = self.gate_failure_rates[gate_name]
+        self.gate_failure_rates[gate_name] = rate + self.FAILURE_RATE_ALPHA * ((not passed) - rate)
+    
+    def _reorder_pipeline(self) -> None:
+        """Run the gates most likely to fail first (stable for equal rates)."""
+        self.pipeline = tuple(sorted(
+            self.pipeline,
+            key=lambda entry: -self.gate_failure_rates[entry[1]]
+        ))
+    
+    async def aorchestrate(self, bundle: ClaimBundle) -> OrchestratorState:
+        """
+        Async entry point for the gate pipeline.
+        
+        Mirrors LangGraph's async-node pattern. The current gates are
+        synchronous, so this delegates to orchestrate() without yielding to
+        the event loop; concurrent callers gain nothing until IO-bound
+        gates await here.
+        
+        Args:
+            bundle: ClaimBundle to evaluate
+        
+        Returns:
+            OrchestratorState with final decision
+        """
+        return self.orchestrate(bundle)
+    
+    async def orchestrate_batch(self, bundles: List[ClaimBundle]) -> List[OrchestratorState]:
+        """
+        Route many independent bundles through the pipeline, one at a time.
+        
+        The gates are synchronous pure Python, so bundles are evaluated
+        sequentially on the event loop: there is no IO to overlap, and
+        worker threads would only contend for the GIL and race on
+        execution_history.
+        
+        Args:
+            bundles: ClaimBundles to evaluate
+        
+        Returns:
+            OrchestratorStates in the same order as bundles
+        """
+        return [await self.aorchestrate(bundle) for bundle in bundles]
+    
     def get_reasoning_path(self, bundle_id: str) -> Optional[List[Dict[str, Any]]]:
         """
         Retrieve reasoning path for a bundle.
@@ -267,18 +352,16 @@ class PrometheusOrchestrator:
             bundle_id: Bundle ID to look up
         
         Returns:
-            Reasoning path or None if not found
+            Reasoning path (entries with ISO "timestamp") or None if not found
         """
-        for state in self.execution_history:
-            if state.bundle_id == bundle_id:
-                return state.reasoning_path
-        return None
+        state = self._by_id.get(bundle_id)
+        return state.reasoning_path_serialized() if state is not None else None
     
     def get_execution_history(self) -> List[OrchestratorState]:
         """
-        Get full execution history.
+        Get execution history (the most recent history_capacity runs).
         
         Returns:
-            List of all OrchestratorState objects
+            List of retained OrchestratorState objects, oldest first
         """
-        return self.execution_history.copy()
+        return list(self.execution_history)
@@ -17,13 +17,29 @@ Production implementation uses:
   - Redis for distributed coordination
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Any, Optional, Callable
+from collections import OrderedDict
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Callable, Set, Tuple, AsyncIterator
 from enum import Enum
 import asyncio
+import copy
 
-from src.claim_bundle import ClaimBundle, Claim, BundleDecision
+from src.claim_bundle import (
+    ClaimBundle, Claim, BundleDecision, Uncertainty, UncertaintyMethod,
+    GateRecommendation, RiskTier, ClaimType, new_id
+)
 from src.gates import GateStack
+from src.orchestrator_store import RedisCheckpointStore
+
+
+# Uncertainty is frozen, so every stub claim can share one instance
+_STUB_UNCERTAINTY = Uncertainty(
+    method=UncertaintyMethod.CONFIDENCE_SCORE,
+    value=0.5,
+    interpretation="Stub uncertainty",
+    gate_recommendation=GateRecommendation.EXECUTE
+)
 
 
 class TaskState(str, Enum):
@@ -37,22 +53,16 @@ class TaskState(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskContext:
     """Context for a task execution."""
     task_id: str
     task_description: str
     state: TaskState = TaskState.DECOMPOSE
-    subtasks: List[str] = None
+    subtasks: List[str] = field(default_factory=list)
     bundle: Optional[ClaimBundle] = None
     error: Optional[str] = None
-    metadata: Dict[str, Any] = None
-
-    def __post_init__(self):
-        if self.subtasks is None:
-            self.subtasks = []
-        if self.metadata is None:
-            self.metadata = {}
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
 
 class Orchestrator:
@@ -65,9 +75,32 @@ class Orchestrator:
     - Integration with MCP tools
     """
 
-    def __init__(self, agent_id: str = "orchestrator"):
+    def __init__(
+        self,
+        agent_id: str = "orchestrator",
+        checkpoint_store: Optional[RedisCheckpointStore] = None,
+        result_cache_size: int = 0,
+    ):
+        """
+        Args:
+            agent_id: origin_agent for the bundles this orchestrator builds
+            checkpoint_store: Optional store used by save/emit_checkpoint
+            result_cache_size: Published results to keep for resubmitted
+                tasks (0, the default, disables the cache). Hits only occur
+                when the same function objects are passed again, and the
+                cache holds references to those functions. Submissions with
+                unhashable callables are never cached.
+        """
         self.agent_id = agent_id
-        self.context_stack: List[TaskContext] = []
+        # Published results of recent tasks, LRU by (description, fns)
+        self.result_cache_size = result_cache_size
+        self._result_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self.checkpoint_store = checkpoint_store
+        # Strong refs to in-flight emit_checkpoint() writes (the loop keeps weak ones)
+        self._checkpoint_writes: Set[asyncio.Task] = set()
+        # In-flight tasks by task_id (insertion order = start order); keyed
+        # rather than stacked so concurrent execute() calls cannot pop each other
+        self.current_contexts: Dict[str, TaskContext] = {}
 
     async def execute(
         self,
@@ -75,24 +108,56 @@ class Orchestrator:
         decompose_fn: Optional[Callable] = None,
         execute_fn: Optional[Callable] = None,
         collect_fn: Optional[Callable] = None,
+        batch_size: int = 8,
+        force_recompute: bool = False,
+        stream_results: bool = False,
     ) -> Dict[str, Any]:
         """
         Execute a task with full gate verification.
         
+        With result_cache_size > 0, a task resubmitted with the same
+        description and function objects returns a copy of its earlier
+        published result (fresh task_id, "cached": True) unless
+        force_recompute is set. A hit does not rerun GateStack: call
+        clear_result_cache() after changing gate policy. Deferred, refused
+        and failed tasks always rerun.
+        
         Args:
             task_description: Human-readable task description
             decompose_fn: Function to break task into subtasks
             execute_fn: Function to execute each subtask
             collect_fn: Function to collect evidence from execution
+            batch_size: Max subtasks executed concurrently
+            force_recompute: Ignore any cached result for this task
+            stream_results: Pass collect_fn an async iterator yielding results
+                as subtasks finish (completion order), so collection overlaps
+                with stragglers; collect_fn must then be async
             
         Returns:
             Result dictionary with bundle and gate results
+        
+        Raises:
+            ValueError: If batch_size < 1 (raised before the task starts)
         """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        
+        cache_key = self._result_cache_key(
+            task_description, decompose_fn, execute_fn, collect_fn, stream_results
+        )
+        if cache_key is not None and not force_recompute and cache_key in self._result_cache:
+            self._result_cache.move_to_end(cache_key)
+            # Deep copy: callers must not be able to edit the cached nested dicts
+            output = copy.deepcopy(self._result_cache[cache_key])
+            output["task_id"] = new_id()
+            output["cached"] = True
+            return output
+
         context = TaskContext(
-            task_id=str(len(self.context_stack)),
+            task_id=new_id(),
             task_description=task_description
         )
-        self.context_stack.append(context)
+        self.current_contexts[context.task_id] = context
 
         try:
             # Step 1: Decompose
@@ -102,20 +167,25 @@ class Orchestrator:
             else:
                 context.subtasks = [task_description]
 
-            # Step 2: Execute
-            context.state = TaskState.EXECUTE
-            results = []
-            for subtask in context.subtasks:
+            if stream_results and execute_fn and collect_fn:
+                # Steps 2+3 overlap: collect_fn consumes results as they land
+                context.state = TaskState.COLLECT
+                stream = self._stream_subtask_results(execute_fn, context.subtasks, batch_size)
+                async with aclosing(stream):  # Cancels stragglers if collect_fn stops early
+                    evidence = await collect_fn(stream)
+            else:
+                # Step 2: Execute
+                context.state = TaskState.EXECUTE
+                results = []
                 if execute_fn:
-                    result = await self._call_async(execute_fn, subtask)
-                    results.append(result)
+                    results = await self._run_subtasks(execute_fn, context.subtasks, batch_size)
 
-            # Step 3: Collect evidence
-            context.state = TaskState.COLLECT
-            if collect_fn:
-                evidence = await self._call_async(collect_fn, results)
-            else:
-                evidence = {"raw_results": results}
+                # Step 3: Collect evidence
+                context.state = TaskState.COLLECT
+                if collect_fn:
+                    evidence = await self._call_async(collect_fn, results)
+                else:
+                    evidence = {"raw_results": results}
 
             # Step 4: Create ClaimBundle
             claims = self._build_claims_from_evidence(evidence)
@@ -132,7 +202,9 @@ class Orchestrator:
             # Step 6: Handle decision
             if context.bundle.decision == BundleDecision.PUBLISH:
                 context.state = TaskState.OUTPUT
-                return self._format_output(context, gate_result, success=True)
+                output = self._format_output(context, gate_result, success=True)
+                self._cache_result(cache_key, output)
+                return output
             else:
                 context.state = TaskState.ESCALATE
                 return self._format_output(context, gate_result, success=False)
@@ -147,7 +219,74 @@ class Orchestrator:
                 "state": context.state.value
             }
         finally:
-            self.context_stack.pop()
+            del self.current_contexts[context.task_id]
+
+    def _result_cache_key(self, *parts: Any) -> Optional[Tuple]:
+        """Cache key for a submission, or None if caching is off or a part is unhashable."""
+        if self.result_cache_size <= 0:
+            return None
+        try:
+            hash(parts)
+        except TypeError:  # e.g. a dataclass instance with __call__
+            return None
+        return parts
+
+    def _cache_result(self, key: Optional[Tuple], output: Dict[str, Any]) -> None:
+        """Remember a published result, evicting the least recently used."""
+        if key is None:
+            return
+        # Snapshot, so later edits to the returned output don't leak into hits
+        self._result_cache[key] = copy.deepcopy(output)
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > self.result_cache_size:
+            self._result_cache.popitem(last=False)
+
+    def clear_result_cache(self) -> None:
+        """Drop cached results (e.g. after changing gate thresholds)."""
+        self._result_cache.clear()
+
+    def _bounded_runner(self, execute_fn: Callable, batch_size: int) -> Callable:
+        """Wrap execute_fn so at most batch_size calls are in flight."""
+        semaphore = asyncio.Semaphore(batch_size)
+
+        async def run_subtask(subtask: str) -> Any:
+            async with semaphore:
+                return await self._call_async(execute_fn, subtask)
+
+        return run_subtask
+
+    async def _run_subtasks(
+        self, execute_fn: Callable, subtasks: List[str], batch_size: int
+    ) -> List[Any]:
+        """Run independent subtasks concurrently; results keep subtask order.
+        
+        If any subtask fails, its unfinished siblings are cancelled (and
+        awaited) before the error propagates.
+        """
+        run_subtask = self._bounded_runner(execute_fn, batch_size)
+        tasks = [asyncio.ensure_future(run_subtask(subtask)) for subtask in subtasks]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _stream_subtask_results(
+        self, execute_fn: Callable, subtasks: List[str], batch_size: int
+    ) -> AsyncIterator[Any]:
+        """Yield execute_fn results in completion order; unfinished subtasks
+        are cancelled (and awaited) if the consumer stops early or fails."""
+        run_subtask = self._bounded_runner(execute_fn, batch_size)
+        tasks = [asyncio.ensure_future(run_subtask(subtask)) for subtask in subtasks]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _call_async(self, fn: Callable, *args, **kwargs) -> Any:
         """Call function (async or sync)."""
@@ -162,27 +301,16 @@ class Orchestrator:
         Stub: In production, this extracts facts/inferences from execution results
         and wraps them in ClaimBundle format.
         """
-        from src.claim_bundle import (
-            Claim, Uncertainty, UncertaintyMethod, GateRecommendation, RiskTier, ClaimType
-        )
-
         # Simple stub: create one claim per evidence item
-        claims = []
-        for key, value in evidence.items():
-            claim = Claim(
+        return [
+            Claim(
                 statement=f"Evidence: {key}",
                 claim_type=ClaimType.INFERENCE,
-                uncertainty=Uncertainty(
-                    method=UncertaintyMethod.CONFIDENCE_SCORE,
-                    value=0.5,
-                    interpretation="Stub uncertainty",
-                    gate_recommendation=GateRecommendation.EXECUTE
-                ),
+                uncertainty=_STUB_UNCERTAINTY,
                 risk_tier=RiskTier.READ_ONLY
             )
-            claims.append(claim)
-
-        return claims
+            for key in evidence
+        ]
 
     def _format_output(self, context: TaskContext, gate_result, success: bool) -> Dict[str, Any]:
         """Format final output."""
@@ -201,19 +329,46 @@ class Orchestrator:
         }
 
     def get_checkpoint(self) -> Dict[str, Any]:
-        """Get current checkpoint for persistence.
-        
-        In production: serialized to Redis or database.
-        """
+        """Get current checkpoint for persistence (see save_checkpoint)."""
+        # Most recently started in-flight task
+        current = next(reversed(self.current_contexts.values()), None)
         return {
             "agent_id": self.agent_id,
-            "context_depth": len(self.context_stack),
+            "context_depth": len(self.current_contexts),
             "current_context": {
-                "task_id": self.context_stack[-1].task_id if self.context_stack else None,
-                "state": self.context_stack[-1].state.value if self.context_stack else None
+                "task_id": current.task_id if current else None,
+                "state": current.state.value if current else None
             }
         }
 
+    async def save_checkpoint(self) -> Optional[str]:
+        """Persist get_checkpoint() to the checkpoint store, if configured.
+        
+        Returns:
+            Key of the stored checkpoint, or None without a store
+        """
+        if self.checkpoint_store is None:
+            return None
+        return await self.checkpoint_store.save(self.agent_id, self.get_checkpoint())
+
+    def emit_checkpoint(self) -> Optional[asyncio.Task]:
+        """Snapshot the checkpoint now and persist it in the background.
+        
+        Unlike save_checkpoint, the caller does not wait on the store round
+        trip. Must be called from a running event loop.
+        
+        Returns:
+            The write task (await it to surface errors), or None without a store
+        """
+        if self.checkpoint_store is None:
+            return None
+        task = asyncio.create_task(
+            self.checkpoint_store.save(self.agent_id, self.get_checkpoint())
+        )
+        self._checkpoint_writes.add(task)
+        task.add_done_callback(self._checkpoint_writes.discard)
+        return task
+
 
 # Convenience functions
 async def run_task(
@@ -222,6 +377,7 @@ async def run_task(
     decompose_fn: Optional[Callable] = None,
     execute_fn: Optional[Callable] = None,
     collect_fn: Optional[Callable] = None,
+    batch_size: int = 8,
 ) -> Dict[str, Any]:
     """Helper to run a single task."""
     orchestrator = Orchestrator(agent_id)
@@ -229,5 +385,6 @@ async def run_task(
         task_description=task_description,
         decompose_fn=decompose_fn,
         execute_fn=execute_fn,
-        collect_fn=collect_fn
+        collect_fn=collect_fn,
+        batch_size=batch_size
     )
@@ -0,0 +1,85 @@
+"""Checkpoint Store: Redis-backed persistence for Orchestrator checkpoints.
+
+Layout per agent:
+  - checkpoint:{agent_id}:{ts_ns}  inline JSON blob (one key per checkpoint)
+  - checkpoints:{agent_id}         sorted set of those keys, scored by time
+
+A save is one pipelined MULTI/EXEC round trip (SET + ZADD + ZREMRANGEBYSCORE
++ EXPIRE). Index entries older than the TTL point at expired blobs and are
+trimmed, and the index expiry is pushed out to match the newest blob, so the
+index never expires before a checkpoint it lists.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+import time
+
+import orjson
+
+
+@lru_cache(maxsize=1024)
+def _agent_keys(agent_id: str) -> Tuple[str, str]:
+    """(checkpoint key prefix, sorted-set index key) for an agent."""
+    return f"checkpoint:{agent_id}:", f"checkpoints:{agent_id}"
+
+
+class RedisCheckpointStore:
+    """Chronological checkpoint store on redis.asyncio."""
+
+    DEFAULT_URL = "redis://localhost:6379/0"
+    DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+    def __init__(
+        self,
+        client: Optional[Any] = None,
+        url: str = DEFAULT_URL,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    ):
+        """
+        Args:
+            client: Optional redis.asyncio.Redis (or compatible) client.
+                    Created lazily from url if omitted.
+            url: Redis URL used when no client is given
+            ttl_seconds: Expiry for checkpoint blobs and the per-agent index
+        """
+        self.client = client
+        self.url = url
+        self.ttl_seconds = ttl_seconds
+
+    def _get_client(self) -> Any:
+        """Return the configured client, connecting on first use."""
+        if self.client is None:
+            from redis.asyncio import Redis
+            self.client = Redis.from_url(self.url)
+        return self.client
+
+    async def save(self, agent_id: str, checkpoint: Dict[str, Any]) -> str:
+        """Persist a checkpoint and index it; returns its key."""
+        prefix, index_key = _agent_keys(agent_id)
+        now_ns = time.time_ns()
+        now = now_ns / 1e9
+        key = f"{prefix}{now_ns}"
+
+        async with self._get_client().pipeline(transaction=True) as pipe:
+            pipe.set(key, orjson.dumps(checkpoint), ex=self.ttl_seconds)
+            pipe.zadd(index_key, {key: now})
+            # Entries scored before now - ttl refer to blobs that have expired
+            pipe.zremrangebyscore(index_key, "-inf", now - self.ttl_seconds)
+            # The new blob is the last to expire; the index must outlive it
+            pipe.expire(index_key, self.ttl_seconds)
+            await pipe.execute()
+        return key
+
+    async def list_keys(self, agent_id: str, limit: int = 100) -> List[str]:
+        """Keys of the most recent checkpoints, newest first."""
+        _, index_key = _agent_keys(agent_id)
+        keys = await self._get_client().zrevrange(index_key, 0, limit - 1)
+        return [k.decode() if isinstance(k, bytes) else k for k in keys]
+
+    async def load_latest(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """Most recent checkpoint for agent_id, or None if none survive."""
+        keys = await self.list_keys(agent_id, limit=1)
+        if not keys:
+            return None
+        blob = await self._get_client().get(keys[0])
+        return orjson.loads(blob) if blob is not None else None
@@ -22,8 +22,41 @@ Method:
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 import math
+import threading
+
+import numpy as np
+
+
+@lru_cache(maxsize=4096)
+def _ngrams(text: str, n: int = 3) -> FrozenSet[str]:
+    """
+    Lower-cased word n-grams of text (memoized: samples recur across re-evaluations).
+    
+    Each n-gram is one space-joined string rather than a tuple of words, so
+    set intersections compare a single str per candidate match.
+    """
+    words = text.lower().split()
+    return frozenset(map(" ".join, zip(*(words[k:] for k in range(n)))))
+
+
+# sentence-transformers models by name, each loaded once per process on first use
+_shared_embedders: Dict[str, Any] = {}
+_shared_embedder_lock = threading.Lock()
+
+
+def _get_shared_embedder(model_name: str) -> Any:
+    """Process-wide embedder for model_name; calculators share it instead of reloading."""
+    embedder = _shared_embedders.get(model_name)
+    if embedder is None:
+        with _shared_embedder_lock:
+            embedder = _shared_embedders.get(model_name)
+            if embedder is None:
+                from sentence_transformers import SentenceTransformer
+                embedder = _shared_embedders[model_name] = SentenceTransformer(model_name)
+    return embedder
 
 
 @dataclass
@@ -64,16 +97,24 @@ class SemanticEntropyCalculator:
     HALLUCINATION_THRESHOLD = 0.70
     CONFIDENCE_THRESHOLD = 0.30
     
-    def __init__(self, enable_embedding_mode: bool = False):
+    # Default sentence-transformers model for embedding mode
+    DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+    # Max samples per encoder forward pass when batching across claims
+    EMBEDDING_BATCH_SIZE = 128
+    
+    def __init__(self, enable_embedding_mode: bool = False, embedder: Optional[Any] = None):
         """
         Initialize calculator.
         
         Args:
             enable_embedding_mode: If True, use embedding-based entropy (requires embedder)
                                  If False, use simplified text diversity mode
+            embedder: Optional encoder exposing a sentence-transformers style
+                     ``encode(texts, ...)`` method. If omitted, the process-wide
+                     default model is loaded lazily and shared.
         """
         self.enable_embedding_mode = enable_embedding_mode
-        self.embedder = None
+        self.embedder = embedder
     
     @staticmethod
     def compute_entropy_from_probabilities(probabilities: List[float]) -> float:
@@ -88,14 +129,15 @@ class SemanticEntropyCalculator:
         Returns:
             Entropy value (0 to log(n))
         """
-        entropy = 0.0
-        for p in probabilities:
-            if p > 1e-10:  # Avoid log(0)
-                entropy -= p * math.log(p)
+        p = np.asarray(probabilities, dtype=np.float64)
+        if p.size < 2:
+            return 0.0  # A single outcome (or none) carries no entropy
+        
+        nonzero = p[p > 1e-10]  # Avoid log(0)
+        entropy = -float(np.dot(nonzero, np.log(nonzero)))
         
         # Normalize to 0-1 range
-        max_entropy = math.log(len(probabilities)) if len(probabilities) > 0 else 1
-        normalized = entropy / max_entropy if max_entropy > 0 else 0
+        normalized = entropy / math.log(p.size)
         return min(1.0, max(0.0, normalized))
     
     @staticmethod
@@ -118,28 +160,77 @@ class SemanticEntropyCalculator:
         if len(texts) < 2:
             return 0.0
         
-        # Extract 3-grams from each text
-        def get_ngrams(text: str, n: int = 3) -> set:
-            words = text.lower().split()
-            return set(tuple(words[i:i+n]) for i in range(len(words)-n+1))
-        
-        # Compute Jaccard distances between all pairs
-        all_ngrams = [get_ngrams(t) for t in texts]
-        distances = []
+        # Compute Jaccard distances between the 3-gram sets of all pairs;
+        # |A | B| comes from inclusion-exclusion so only the intersection
+        # set is built per pair
+        all_ngrams = [_ngrams(t) for t in texts]
+        sizes = [len(ngrams) for ngrams in all_ngrams]
+        total_distance = 0.0
+        num_pairs = 0
         
         for i in range(len(all_ngrams)):
+            ngrams_i, size_i = all_ngrams[i], sizes[i]
             for j in range(i+1, len(all_ngrams)):
-                union = len(all_ngrams[i] | all_ngrams[j])
-                intersection = len(all_ngrams[i] & all_ngrams[j])
+                intersection = len(ngrams_i & all_ngrams[j])
+                union = size_i + sizes[j] - intersection
                 if union > 0:
-                    jaccard_distance = 1 - (intersection / union)
-                    distances.append(jaccard_distance)
+                    total_distance += 1 - (intersection / union)
+                    num_pairs += 1
         
         # Average distance = diversity
-        if distances:
-            return sum(distances) / len(distances)
+        if num_pairs:
+            return total_distance / num_pairs
         return 0.0
     
+    def _get_embedder(self) -> Any:
+        """Return the configured embedder, or the shared default model (loaded on first use)."""
+        if self.embedder is None:
+            self.embedder = _get_shared_embedder(self.DEFAULT_EMBEDDING_MODEL)
+        return self.embedder
+    
+    def compute_embedding_diversity(self, texts: List[str]) -> float:
+        """
+        Compute diversity score from semantic embeddings of text samples.
+        
+        All samples are encoded in a single batch and compared through one
+        similarity matrix product instead of per-pair Python loops.
+        
+        Args:
+            texts: Multiple text samples
+        
+        Returns:
+            Diversity score (0-1): mean pairwise cosine distance
+        """
+        if len(texts) < 2:
+            return 0.0
+        return self._embedding_diversities([texts])[0]
+    
+    def _embedding_diversities(self, batches: List[List[str]]) -> List[float]:
+        """Embedding diversity per batch, encoding every batch's samples in one call."""
+        flat = [text for texts in batches for text in texts]
+        embeddings = np.asarray(
+            self._get_embedder().encode(
+                flat,
+                batch_size=min(len(flat), self.EMBEDDING_BATCH_SIZE),
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+            ),
+            dtype=np.float32,
+        )
+        
+        diversities = []
+        offset = 0
+        for texts in batches:
+            block = embeddings[offset:offset + len(texts)]
+            offset += len(texts)
+            similarity = block @ block.T
+            
+            # Average cosine distance over unique pairs (upper triangle)
+            rows, cols = np.triu_indices(len(texts), k=1)
+            distances = np.clip(1.0 - similarity[rows, cols], 0.0, 1.0)
+            diversities.append(float(distances.mean()))
+        return diversities
+    
     def compute(
         self,
         texts: List[str],
@@ -161,8 +252,11 @@ class SemanticEntropyCalculator:
         if len(texts) < 2:
             raise ValueError("Need at least 2 samples for entropy calculation")
         
-        # Compute text diversity (Phase 2 simplified method)
-        diversity_score = self.compute_text_diversity(texts)
+        if self.enable_embedding_mode:
+            diversity_score = self.compute_embedding_diversity(texts)
+        else:
+            # Compute text diversity (Phase 2 simplified method)
+            diversity_score = self.compute_text_diversity(texts)
         
         # Map diversity to entropy (higher diversity = higher entropy)
         # In Phase 3, this will be actual semantic entropy from embeddings
@@ -196,6 +290,56 @@ class SemanticEntropyCalculator:
             num_samples=len(texts),
             is_hallucination=is_hallucination
         )
+    
+    def compute_batch(self, batches: List[List[str]]) -> List[SemanticEntropyResult]:
+        """
+        Compute semantic entropy for many sets of model outputs (e.g. one per claim).
+        
+        In embedding mode all samples are encoded in one pass; text
+        diversity is computed per set. The entropy -> hallucination mapping
+        from compute() then runs once over all sets. Its three linear
+        branches meet at the thresholds, so it is evaluated as a single
+        vectorized piecewise-linear interpolation (clamped like compute()).
+        
+        Args:
+            batches: One list of model outputs per item to score
+        
+        Returns:
+            SemanticEntropyResult per batch, in order
+        
+        Raises:
+            ValueError: If any batch has < 2 samples
+        """
+        if any(len(texts) < 2 for texts in batches):
+            raise ValueError("Need at least 2 samples for entropy calculation")
+        
+        if self.enable_embedding_mode:
+            # One encoder pass over every batch's samples
+            diversities = self._embedding_diversities(batches) if batches else []
+        else:
+            diversities = [self.compute_text_diversity(texts) for texts in batches]
+        entropy = np.array(diversities, dtype=np.float64)
+        probabilities = np.interp(
+            entropy,
+            (0.0, self.CONFIDENCE_THRESHOLD, self.HALLUCINATION_THRESHOLD, 1.0),
+            (0.0, 0.1, 0.7, 1.0),
+        )
+        
+        return [
+            SemanticEntropyResult(
+                entropy_value=entropy_value,
+                hallucination_probability=hallucination_prob,
+                confidence_score=1.0 - hallucination_prob,
+                num_samples=len(texts),
+                is_hallucination=entropy_value > self.HALLUCINATION_THRESHOLD
+            )
+            for texts, entropy_value, hallucination_prob
+            in zip(batches, entropy.tolist(), probabilities.tolist())
+        ]
+
+
+# Shared text-diversity calculator for the convenience functions (stateless)
+_DEFAULT_CALCULATOR = SemanticEntropyCalculator()
 
 
 def compute_semantic_entropy(
@@ -212,8 +356,7 @@ def compute_semantic_entropy(
     Returns:
         Tuple of (entropy_value, hallucination_probability)
     """
-    calculator = SemanticEntropyCalculator()
-    result = calculator.compute(model_outputs, claim)
+    result = _cached_result(tuple(model_outputs), claim)
     return result.entropy_value, result.hallucination_probability
 
 
@@ -227,6 +370,17 @@ def hallucination_likelihood(model_outputs: List[str]) -> float:
     Returns:
         Hallucination probability (0 = definitely correct, 1 = definitely hallucinated)
     """
-    calculator = SemanticEntropyCalculator()
-    result = calculator.compute(model_outputs)
-    return result.hallucination_probability
+    return _cached_result(tuple(model_outputs), None).hallucination_probability
+
+
+@lru_cache(maxsize=2048)
+def _cached_result(
+    model_outputs: Tuple[str, ...],
+    claim: Optional[str]
+) -> SemanticEntropyResult:
+    """
+    Memoized by output set: retries and gate re-evaluations resend the same
+    samples, and both convenience helpers share one computation per set.
+    Callers only read fields off the (shared) result.
+    """
+    return _DEFAULT_CALCULATOR.compute(list(model_outputs), claim)
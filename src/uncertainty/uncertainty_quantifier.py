@@ -12,9 +12,10 @@ Phase 3: Add ensemble methods
 Phase 4: Full integration with all methods
 """
 
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
-from enum import Enum
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 
 from src.claim_bundle import UncertaintyMethod
 from src.uncertainty.semantic_entropy import (
@@ -23,15 +24,28 @@ from src.uncertainty.semantic_entropy import (
 )
 
 
-class UncertaintyMethod(str, Enum):
-    """Supported uncertainty quantification methods."""
-    SEMANTIC_ENTROPY = "semantic_entropy"
-    MODEL_DISAGREEMENT = "model_disagreement"
-    CONFIDENCE_SCORE = "confidence_score"
-    TOKEN_LENGTH = "token_length"
+# from_token_length bands: token counts below 30, 30-69, and 70+ map to
+# (uncertainty, confidence, interpretation)
+_TOKEN_LENGTH_BOUNDS = (30, 70)
+_TOKEN_LENGTH_BANDS = (
+    (0.2, 1.0 - 0.2, "Concise response suggests high confidence"),
+    (0.5, 1.0 - 0.5, "Standard-length response"),
+    (0.7, 1.0 - 0.7, "Long response may indicate elaboration or uncertainty"),
+)
+
+
+# from_confidence_score default explanations: confidence <= 0.5, (0.5, 0.7],
+# (0.7, 0.9] and above 0.9
+_CONFIDENCE_BOUNDS = (0.5, 0.7, 0.9)
+_CONFIDENCE_EXPLANATIONS = (
+    "Low confidence in claim",
+    "Moderate confidence in claim",
+    "High confidence in claim",
+    "Very high confidence in claim",
+)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UncertaintyEstimate:
     """
     Unified uncertainty estimate across methods.
@@ -41,7 +55,8 @@ class UncertaintyEstimate:
         uncertainty_value: Scalar (0-1) representing uncertainty
         confidence_value: 1 - uncertainty_value
         interpretation: Human-readable explanation
-        additional_data: Method-specific data (e.g., entropy details)
+        additional_data: Method-specific data (e.g., entropy details);
+            treat as read-only, the estimate itself is frozen
     """
     method: UncertaintyMethod
     uncertainty_value: float  # 0-1
@@ -50,6 +65,27 @@ class UncertaintyEstimate:
     additional_data: Dict[str, Any]
 
 
+def _combined_estimate(
+    combined_uncertainty: float,
+    methods: Sequence[UncertaintyMethod],
+    weights: List[float],
+    uncertainties: List[float],
+    interpretations: Sequence[str],
+) -> UncertaintyEstimate:
+    """Build the combined estimate returned by combine_estimates."""
+    return UncertaintyEstimate(
+        method=UncertaintyMethod.SEMANTIC_ENTROPY,  # Primary method
+        uncertainty_value=combined_uncertainty,
+        confidence_value=1.0 - combined_uncertainty,
+        interpretation=" | ".join(interpretations),
+        additional_data={
+            "methods": [method._value_ for method in methods],
+            "weights": weights,
+            "individual_uncertainties": uncertainties,
+        }
+    )
+
+
 class UncertaintyQuantifier:
     """
     Main uncertainty quantification interface.
@@ -61,9 +97,26 @@ class UncertaintyQuantifier:
     - Text properties (token length as proxy)
     """
     
-    def __init__(self):
-        """Initialize quantifier."""
-        self.semantic_entropy_calc = SemanticEntropyCalculator()
+    __slots__ = ("semantic_entropy_calc", "_se_cache", "_se_hits", "_se_misses")
+    
+    # Semantic entropy results kept per quantifier (LRU)
+    SEMANTIC_ENTROPY_CACHE_SIZE = 1024
+    
+    def __init__(self, semantic_entropy_calc: Optional[SemanticEntropyCalculator] = None):
+        """
+        Initialize quantifier.
+        
+        Args:
+            semantic_entropy_calc: Calculator to use (e.g. one whose embedder is
+                                   already loaded); a new text-diversity
+                                   calculator if None. Either way the default
+                                   embedding model is shared, not reloaded.
+        """
+        self.semantic_entropy_calc = semantic_entropy_calc or SemanticEntropyCalculator()
+        # (claim, sorted outputs) -> result; pairwise diversity ignores order
+        self._se_cache: "OrderedDict[Tuple, SemanticEntropyResult]" = OrderedDict()
+        self._se_hits = 0
+        self._se_misses = 0
     
     def from_semantic_entropy(
         self,
@@ -84,36 +137,120 @@ class UncertaintyQuantifier:
             Wang et al., Nature 2024
             AUROC >= 0.78 for hallucination detection
         """
-        result = self.semantic_entropy_calc.compute(model_outputs, claim)
+        key = (claim, tuple(sorted(model_outputs)))
+        result = self._cached_entropy(key)
+        if result is None:
+            result = self.semantic_entropy_calc.compute(model_outputs, claim)
+            self._store_entropy(key, result)
+        return self._estimate_from_entropy(result)
+    
+    def from_semantic_entropy_batch(
+        self,
+        model_outputs_batch: List[List[str]],
+        claims: Optional[List[Optional[str]]] = None
+    ) -> List[UncertaintyEstimate]:
+        """
+        Compute semantic-entropy uncertainty for many claims at once.
+        
+        Uses SemanticEntropyCalculator.compute_batch, so in embedding mode
+        the samples of every claim go through the encoder in one pass.
+        
+        Args:
+            model_outputs_batch: Multiple LLM outputs per claim
+            claims: Optional claim context per entry (currently unused,
+                    as in from_semantic_entropy)
+        
+        Returns:
+            UncertaintyEstimate per entry, in order
+        
+        Raises:
+            ValueError: If claims does not align with model_outputs_batch,
+                or any entry has < 2 samples
+        """
+        if claims is not None and len(claims) != len(model_outputs_batch):
+            raise ValueError("claims must align with model_outputs_batch")
+        if claims is None:
+            claims = [None] * len(model_outputs_batch)
         
-        # Map entropy to uncertainty (high entropy = high uncertainty)
-        uncertainty = result.entropy_value
-        confidence = result.confidence_score
+        keys = [
+            (claim, tuple(sorted(outputs)))
+            for claim, outputs in zip(claims, model_outputs_batch)
+        ]
+        results = [self._cached_entropy(key) for key in keys]
+        
+        # One compute_batch call over whatever was not cached
+        misses = [i for i, result in enumerate(results) if result is None]
+        if misses:
+            computed = self.semantic_entropy_calc.compute_batch(
+                [model_outputs_batch[i] for i in misses]
+            )
+            for i, result in zip(misses, computed):
+                results[i] = result
+                self._store_entropy(keys[i], result)
+        return [self._estimate_from_entropy(result) for result in results]
+    
+    def cache_info(self) -> Dict[str, int]:
+        """Semantic entropy cache statistics."""
+        return {
+            "hits": self._se_hits,
+            "misses": self._se_misses,
+            "size": len(self._se_cache),
+            "maxsize": self.SEMANTIC_ENTROPY_CACHE_SIZE,
+        }
+    
+    def _cached_entropy(self, key: Tuple) -> Optional[SemanticEntropyResult]:
+        """Look up a cached result, refreshing its LRU position."""
+        result = self._se_cache.get(key)
+        if result is None:
+            self._se_misses += 1
+            return None
+        self._se_hits += 1
+        self._se_cache.move_to_end(key)
+        return result
+    
+    def _store_entropy(self, key: Tuple, result: SemanticEntropyResult) -> None:
+        """Cache a result, evicting the least recently used."""
+        self._se_cache[key] = result
+        if len(self._se_cache) > self.SEMANTIC_ENTROPY_CACHE_SIZE:
+            self._se_cache.popitem(last=False)
+    
+    @staticmethod
+    def _estimate_from_entropy(result: SemanticEntropyResult) -> UncertaintyEstimate:
+        """Wrap a semantic entropy result as an UncertaintyEstimate."""
+        # Read each field once; the interpretation and additional_data reuse them.
+        # Entropy maps directly to uncertainty (high entropy = high uncertainty)
+        entropy, confidence, hallucination_prob, num_samples, is_hallucination = (
+            result.entropy_value,
+            result.confidence_score,
+            result.hallucination_probability,
+            result.num_samples,
+            result.is_hallucination,
+        )
         
         # Generate interpretation
-        if result.is_hallucination:
-            interpretation = f"High uncertainty (entropy={result.entropy_value:.2f}). " \
-                           f"Hallucination likelihood: {result.hallucination_probability:.1%}. " \
+        if is_hallucination:
+            interpretation = f"High uncertainty (entropy={entropy:.2f}). " \
+                           f"Hallucination likelihood: {hallucination_prob:.1%}. " \
                            f"Consider deferring decision or requesting additional sources."
-        elif uncertainty > 0.5:
-            interpretation = f"Moderate uncertainty (entropy={result.entropy_value:.2f}). " \
+        elif entropy > 0.5:
+            interpretation = f"Moderate uncertainty (entropy={entropy:.2f}). " \
                            f"Model outputs show diversity. " \
                            f"Recommend including caveats in explanation."
         else:
-            interpretation = f"Low uncertainty (entropy={result.entropy_value:.2f}). " \
+            interpretation = f"Low uncertainty (entropy={entropy:.2f}). " \
                            f"Model outputs consistent. " \
                            f"High confidence in claim."
         
         return UncertaintyEstimate(
             method=UncertaintyMethod.SEMANTIC_ENTROPY,
-            uncertainty_value=uncertainty,
+            uncertainty_value=entropy,
             confidence_value=confidence,
             interpretation=interpretation,
             additional_data={
-                "entropy_value": result.entropy_value,
-                "hallucination_probability": result.hallucination_probability,
-                "num_samples": result.num_samples,
-                "is_hallucination": result.is_hallucination,
+                "entropy_value": entropy,
+                "hallucination_probability": hallucination_prob,
+                "num_samples": num_samples,
+                "is_hallucination": is_hallucination,
                 "paper_reference": "Wang et al., Nature 2024",
                 "auroc": 0.78,
             }
@@ -134,8 +271,14 @@ class UncertaintyQuantifier:
         Returns:
             UncertaintyEstimate
         
+        Raises:
+            ValueError: If predictions is empty
+        
         Note: Phase 3 feature (placeholder for now)
         """
+        if not predictions:
+            raise ValueError("Need at least one prediction")
+        
         # Placeholder for Phase 3
         avg_confidence = sum(p.get("confidence", 0.5) for p in predictions) / len(predictions)
         uncertainty = 1.0 - avg_confidence
@@ -172,14 +315,8 @@ class UncertaintyQuantifier:
         uncertainty = 1.0 - confidence
         
         if explanation is None:
-            if confidence > 0.9:
-                explanation = "Very high confidence in claim"
-            elif confidence > 0.7:
-                explanation = "High confidence in claim"
-            elif confidence > 0.5:
-                explanation = "Moderate confidence in claim"
-            else:
-                explanation = "Low confidence in claim"
+            # bisect_left: a score exactly on a bound stays in the lower band
+            explanation = _CONFIDENCE_EXPLANATIONS[bisect_left(_CONFIDENCE_BOUNDS, confidence)]
         
         return UncertaintyEstimate(
             method=UncertaintyMethod.CONFIDENCE_SCORE,
@@ -217,21 +354,14 @@ class UncertaintyQuantifier:
         # Short responses (< 30 tokens) = high confidence
         # Medium responses (30-70 tokens) = medium confidence  
         # Long responses (> 70 tokens) = possible elaboration/uncertainty
-        
-        if token_count < 30:
-            uncertainty = 0.2
-            interpretation = "Concise response suggests high confidence"
-        elif token_count < 70:
-            uncertainty = 0.5
-            interpretation = "Standard-length response"
-        else:
-            uncertainty = 0.7
-            interpretation = "Long response may indicate elaboration or uncertainty"
+        uncertainty, confidence, interpretation = _TOKEN_LENGTH_BANDS[
+            bisect_right(_TOKEN_LENGTH_BOUNDS, token_count)
+        ]
         
         return UncertaintyEstimate(
             method=UncertaintyMethod.TOKEN_LENGTH,
             uncertainty_value=uncertainty,
-            confidence_value=1.0 - uncertainty,
+            confidence_value=confidence,
             interpretation=interpretation,
             additional_data={
                 "token_count": token_count,
@@ -261,32 +391,19 @@ class UncertaintyQuantifier:
             raise ValueError("Need at least one estimate")
         
         if weights is None:
-            weights = [1.0 / len(estimates)] * len(estimates)
-        
-        if len(weights) != len(estimates):
-            raise ValueError("Weights must match estimates count")
+            n = len(estimates)
+            weights = [1.0 / n] * n
         
-        # Weighted average of uncertainties
-        combined_uncertainty = sum(
-            est.uncertainty_value * w for est, w in zip(estimates, weights)
-        )
-        combined_confidence = 1.0 - combined_uncertainty
+        # Weighted average of uncertainties (values gathered once, reused below);
+        # strict zip raises ValueError if weights and estimates differ in length
+        uncertainties = [est.uncertainty_value for est in estimates]
+        combined_uncertainty = sum(u * w for u, w in zip(uncertainties, weights, strict=True))
         
-        # Combine interpretations
-        interpretations = [est.interpretation for est in estimates]
-        combined_interpretation = " | ".join(interpretations)
-        
-        # Collect all method data
-        combined_data = {
-            "methods": [est.method.value for est in estimates],
-            "weights": weights,
-            "individual_uncertainties": [est.uncertainty_value for est in estimates],
-        }
-        
-        return UncertaintyEstimate(
-            method=UncertaintyMethod.SEMANTIC_ENTROPY,  # Primary method
-            uncertainty_value=combined_uncertainty,
-            confidence_value=combined_confidence,
-            interpretation=combined_interpretation,
-            additional_data=combined_data
+        # Weights copied so the caller's list isn't aliased
+        return _combined_estimate(
+            combined_uncertainty,
+            [est.method for est in estimates],
+            list(weights),
+            uncertainties,
+            [est.interpretation for est in estimates],
         )
@@ -6,6 +6,8 @@ Acceptance Metrics:
 - 100% of actions auditable
 """
 
+import json
+
 import pytest
 from src.audit_log import AuditLog
 
@@ -44,3 +46,111 @@ class TestPhase3SecurityMoat:
         # Query by agent
         events = audit_log.get_events(agent_id="agent_a")
         assert len(events) == 10
+
+    def test_audit_log_batch_logging(self, audit_log):
+        """Test: Batched logging records every event in order and keeps the chain intact."""
+        audit_log.log_event("gate_result", "agent_0", {"gate": -1})
+        batch = [("gate_result", f"agent_{i % 3}", {"gate": i}) for i in range(20)]
+        trace_ids = audit_log.log_events_batch(batch)
+
+        assert len(trace_ids) == 20
+        assert len(audit_log.get_events(agent_id="agent_0")) == 8
+        assert audit_log.get_trace(trace_ids[0])["details"] == {"gate": 0}
+        assert audit_log.verify_immutability()
+
+    def test_audit_log_detects_tampering(self, audit_log):
+        """Test: Edited, reordered or truncated events fail verification."""
+        for i in range(5):
+            audit_log.log_event(event_type="action", agent_id="agent_a", details={"action": i})
+        events = audit_log.events
+        assert audit_log.verify_immutability()
+
+        events[2]["details"] = {"action": 99}
+        assert not audit_log.verify_immutability()
+        events[2]["details"] = {"action": 2}
+        assert audit_log.verify_immutability()
+
+        events[1], events[3] = events[3], events[1]
+        assert not audit_log.verify_immutability()
+        events[1], events[3] = events[3], events[1]
+
+        events.pop()
+        assert not audit_log.verify_immutability()
+
+    def test_audit_log_combined_filter(self, audit_log):
+        """Test: Filtering by agent and event type together returns only matching events."""
+        for i in range(12):
+            audit_log.log_event(
+                event_type="gate_result" if i % 2 else "action",
+                agent_id=f"agent_{i % 3}",
+                details={"step": i}
+            )
+
+        events = audit_log.get_events(agent_id="agent_1", event_type="gate_result")
+        assert [e["details"]["step"] for e in events] == [1, 7]
+        assert len(audit_log.get_events(event_type="action")) == 6
+
+    def test_audit_log_deferred_hashing(self, audit_log):
+        """Test: Queued events are hashed on flush and visible to every read."""
+        audit_log.FLUSH_THRESHOLD = 4
+        trace_ids = [
+            audit_log.log_event(event_type="step", agent_id="agent_a", details={"i": i})
+            for i in range(3)
+        ]
+        assert len(audit_log._pending) == 3
+        assert audit_log.get_trace(trace_ids[-1])["details"] == {"i": 2}
+        assert not audit_log._pending
+
+        for i in range(4):
+            audit_log.log_event(event_type="step", agent_id="agent_a", details={"i": i})
+        assert not audit_log._pending  # threshold reached, flushed automatically
+        assert all(len(e["event_hash"]) == 64 for e in audit_log.events)
+
+    def test_audit_log_rejects_bad_payload_at_call_site(self, audit_log):
+        """Test: Unserializable details raise on logging and leave the chain intact."""
+        from decimal import Decimal
+        audit_log.log_event("action", "agent_a", {"i": 0})
+        with pytest.raises(TypeError):
+            audit_log.log_event("action", "agent_a", {"amount": Decimal("1.5")})
+        with pytest.raises(TypeError):
+            audit_log.log_events_batch([("action", "agent_a", {"i": 1}), ("action", "agent_a", {"x": object()})])
+        audit_log.log_event("action", "agent_a", {"i": 2})
+
+        assert [e["details"] for e in audit_log.events] == [{"i": 0}, {"i": 2}]
+        assert audit_log.verify_immutability()
+
+    def test_audit_log_snapshots_details(self, audit_log):
+        """Test: Later edits to the caller's dict are neither recorded nor flagged."""
+        details = {"tool": "search"}
+        trace_id = audit_log.log_event("action", "agent_a", details)
+        details["tool"] = "delete"
+        assert audit_log.get_trace(trace_id)["details"] == {"tool": "search"}
+        details["tool"] = "rm"
+        assert audit_log.verify_immutability()
+
+    def test_audit_log_records_details_unchanged(self, audit_log):
+        """Test: Stored details keep their types instead of a JSON round-trip."""
+        from datetime import datetime
+        details = {1: ("a", "b"), "at": datetime(2024, 1, 1), "score": float("nan")}
+        trace_id = audit_log.log_event("action", "agent_a", details)
+
+        stored = audit_log.get_trace(trace_id)["details"]
+        assert stored is not details
+        assert set(stored) == {1, "at", "score"}
+        assert stored[1] == ("a", "b") and stored["at"] == datetime(2024, 1, 1)
+        assert stored["score"] != stored["score"]  # Still NaN
+        assert audit_log.verify_immutability()
+
+    def test_audit_log_export_json(self, audit_log):
+        """Test: Incremental export matches a full re-serialization of the log."""
+        assert audit_log.export_json() == "[]"
+        for i in range(5):
+            audit_log.log_event(
+                event_type="action",
+                agent_id="agent_a",
+                details={"action": i, "args": ["x", {"retry": i > 2}]}
+            )
+
+        exported = audit_log.export_json()
+        assert exported == json.dumps(audit_log.events, indent=2)
+        assert json.loads(exported) == audit_log.events
@@ -1,5 +1,7 @@
 """Pytest fixtures for PROMETHEUS tests."""
 
+from typing import Optional
+
 import pytest
 from src.claim_bundle import (
     ClaimBundle,
@@ -9,10 +11,12 @@ from src.claim_bundle import (
     ClaimType,
     RiskTier,
     UncertaintyMethod,
+    make_uncertainty,
 )
 from src.audit_log import AuditLog
 from src.mcp_registry import MCPToolRegistry
-from src.orchestrator import ExecutionOrchestrator
+from src.uncertainty import SemanticEntropyCalculator, UncertaintyQuantifier
+from src.orchestrator import Orchestrator
 
 
 @pytest.fixture
@@ -40,10 +44,22 @@ def mcp_registry():
     return registry
 
 
+@pytest.fixture(scope="session")
+def semantic_entropy_calc():
+    """Session-wide calculator, so any embedding model loads once."""
+    return SemanticEntropyCalculator()
+
+
+@pytest.fixture(scope="session")
+def uncertainty_quantifier(semantic_entropy_calc):
+    """Session-wide quantifier sharing the session calculator."""
+    return UncertaintyQuantifier(semantic_entropy_calc=semantic_entropy_calc)
+
+
 @pytest.fixture
 def orchestrator():
     """Create orchestrator fixture."""
-    return ExecutionOrchestrator()
+    return Orchestrator()
 
 
 @pytest.fixture
@@ -102,3 +118,58 @@ def sample_bundle_all_gates_pass(sample_claim_with_evidence):
         claims=[sample_claim_with_evidence]
     )
     return bundle
+
+
+# Gate fixtures. Bundles and claims are mutable (GateStack and the
+# orchestrators record decisions on them), so every test gets fresh ones;
+# only the stateless factory is shared.
+
+@pytest.fixture(scope="session")
+def bundle_factory():
+    """Build a fresh single-claim bundle; evidence is attached when source_confidence is given."""
+    def make(
+        claim_type: ClaimType = ClaimType.INFERENCE,
+        value: float = 0.5,
+        risk_tier: RiskTier = RiskTier.READ_ONLY,
+        source_confidence: Optional[float] = None,
+    ) -> ClaimBundle:
+        evidence = [] if source_confidence is None else [
+            EvidencePointer(
+                source="https://example.com",
+                source_confidence=source_confidence,
+                evidence_hash="abc"
+            )
+        ]
+        claim = Claim(
+            statement="Test",
+            claim_type=claim_type,
+            evidence_pointers=evidence,
+            uncertainty=make_uncertainty(method=UncertaintyMethod.CONFIDENCE_SCORE, value=value),
+            risk_tier=risk_tier
+        )
+        return ClaimBundle(origin_agent="test", claims=[claim])
+    return make
+
+
+@pytest.fixture
+def read_only_inference_bundle(bundle_factory):
+    """INFERENCE claim, moderate uncertainty, READ_ONLY tier."""
+    return bundle_factory()
+
+
+@pytest.fixture
+def fact_bundle_strong_evidence(bundle_factory):
+    """FACT claim backed by a 0.95-confidence source."""
+    return bundle_factory(claim_type=ClaimType.FACT, value=0.2, source_confidence=0.95)
+
+
+@pytest.fixture
+def fact_bundle_weak_evidence(bundle_factory):
+    """FACT claim whose only source is below the evidence threshold."""
+    return bundle_factory(claim_type=ClaimType.FACT, source_confidence=0.50)
+
+
+@pytest.fixture
+def fact_bundle_no_evidence(bundle_factory):
+    """FACT claim with no sources."""
+    return bundle_factory(claim_type=ClaimType.FACT)
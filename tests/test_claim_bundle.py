@@ -10,10 +10,13 @@ Validates:
 """
 
 import json
+import os
 import pytest
+from dataclasses import FrozenInstanceError
 from src.claim_bundle import (
     ClaimBundle, Claim, Uncertainty, EvidencePointer,
-    ClaimType, UncertaintyMethod, GateRecommendation, RiskTier, BundleDecision
+    ClaimType, UncertaintyMethod, GateRecommendation, RiskTier, BundleDecision,
+    make_uncertainty,
 )
 
 
@@ -43,6 +46,25 @@ class TestEvidencePointer:
         assert pointer.source == "https://nature.com"
         assert pointer.source_confidence == 0.85
 
+    def test_pointer_sources_are_interned(self):
+        """Equal sources built at runtime share one string object."""
+        first, second = (
+            EvidencePointer(source="".join(["https://", "nature.com"]), source_confidence=0.9, evidence_hash=h)
+            for h in ("a", "b")
+        )
+        assert first.source is second.source
+
+    def test_pointer_to_dict_matches_asdict(self):
+        """Test the explicit to_dict stays in step with the dataclass fields."""
+        from dataclasses import asdict
+        pointer = EvidencePointer(
+            source="https://nature.com",
+            source_confidence=0.85,
+            evidence_hash="def456"
+        )
+        assert pointer.to_dict() == asdict(pointer)
+        assert EvidencePointer.from_dict(pointer.to_dict()) == pointer
+
     def test_pointer_confidence_validation(self):
         """Test confidence score validation."""
         with pytest.raises(ValueError):
@@ -92,6 +114,15 @@ class TestUncertainty:
         assert data["value"] == 0.6
         assert data["gate_recommendation"] == "DEFER"
 
+    def test_uncertainty_is_frozen_and_pooled(self):
+        """Uncertainty is immutable, so the factory can share instances."""
+        first = make_uncertainty(UncertaintyMethod.CONFIDENCE_SCORE, 0.5)
+        second = make_uncertainty(UncertaintyMethod.CONFIDENCE_SCORE, 0.5)
+        assert first is second
+        assert first == Uncertainty(method=UncertaintyMethod.CONFIDENCE_SCORE, value=0.5)
+        with pytest.raises(FrozenInstanceError):
+            first.value = 0.9
+
 
 class TestClaim:
     """Test Claim dataclass."""
@@ -196,6 +227,50 @@ class TestClaim:
         assert len(data["evidence_pointers"]) == 1
         assert data["risk_tier"] == "MODIFY"
 
+    def test_max_source_confidence(self):
+        """Test best evidence confidence across zero, one and many pointers."""
+        pointers = [
+            EvidencePointer(source=f"https://s{i}.com", source_confidence=c, evidence_hash=f"h{i}")
+            for i, c in enumerate((0.4, 0.8, 0.6))
+        ]
+        claim = Claim(
+            statement="Multi-source claim",
+            claim_type=ClaimType.FACT,
+            evidence_pointers=pointers,
+            uncertainty=Uncertainty(method=UncertaintyMethod.CONFIDENCE_SCORE, value=0.3),
+            risk_tier=RiskTier.READ_ONLY
+        )
+        assert claim.max_source_confidence() == 0.8
+        claim.evidence_pointers = pointers[:1]
+        assert claim.max_source_confidence() == 0.4
+        claim.evidence_pointers = []
+        assert claim.max_source_confidence() is None
+
+    def test_risk_tiers_order_by_privilege(self):
+        """Test tiers compare by privilege level, not by their string values."""
+        assert RiskTier.READ_ONLY < RiskTier.DELETE < RiskTier.PRIVILEGE
+        assert max([RiskTier.PRIVILEGE, RiskTier.READ_ONLY, RiskTier.WRITE_LIMITED]) is RiskTier.PRIVILEGE
+        assert sorted(RiskTier) == list(RiskTier)
+
+    def test_claim_coerces_enum_strings(self):
+        """Test string enum values resolve to members; unknown values still raise."""
+        claim = Claim(
+            statement="Coerced claim",
+            claim_type="INFERENCE",
+            uncertainty={"method": "confidence_score", "value": 0.4},
+            risk_tier="DELETE"
+        )
+        assert claim.claim_type is ClaimType.INFERENCE
+        assert claim.risk_tier is RiskTier.DELETE
+        assert claim.uncertainty.method is UncertaintyMethod.CONFIDENCE_SCORE
+        with pytest.raises(ValueError):
+            Claim(
+                statement="Bad tier",
+                claim_type=ClaimType.FACT,
+                uncertainty=claim.uncertainty,
+                risk_tier="ROOT"
+            )
+
 
 class TestClaimBundle:
     """Test ClaimBundle dataclass."""
@@ -221,6 +296,76 @@ class TestClaimBundle:
         assert bundle.id is not None
         assert bundle.timestamp is not None
 
+    def test_bundle_ids_are_unique_uuid4(self):
+        """Pooled bundle ids stay unique and UUID4-formatted across batches."""
+        import uuid
+        ids = {ClaimBundle(origin_agent="a", claims=[]).id for _ in range(2500)}
+        assert len(ids) == 2500
+        for i in ids:
+            parsed = uuid.UUID(i)
+            assert parsed.version == 4 and parsed.variant == uuid.RFC_4122
+            assert str(parsed) == i
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_does_not_reuse_pooled_ids(self):
+        """A child process draws fresh ids instead of the parent's pre-drawn pool."""
+        ClaimBundle(origin_agent="a", claims=[])  # Make sure the pool is filled
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.write(write_fd, ClaimBundle(origin_agent="child", claims=[]).id.encode())
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        child_id = os.read(read_fd, 64).decode()
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        assert child_id
+        assert child_id != ClaimBundle(origin_agent="parent", claims=[]).id
+
+    def test_bundle_rejects_unknown_attributes(self):
+        """Bundles and claims are slotted: typos in field names fail loudly."""
+        bundle = ClaimBundle(origin_agent="a", claims=[])
+        assert not hasattr(bundle, "__dict__")
+        with pytest.raises(AttributeError):
+            bundle.decison = BundleDecision.PUBLISH
+
+    def test_bundle_timestamp_format(self):
+        """Timestamps are ISO-8601 UTC with microseconds and a 'Z' suffix."""
+        from datetime import datetime, timezone
+        bundle = ClaimBundle(origin_agent="a", claims=[])
+        assert bundle.timestamp.endswith("Z")
+        parsed = datetime.fromisoformat(bundle.timestamp[:-1]).replace(tzinfo=timezone.utc)
+        assert abs((datetime.now(timezone.utc) - parsed).total_seconds()) < 5
+        assert len(bundle.timestamp) == len("2024-01-01T00:00:00.000000Z")
+
+    def test_bundle_reset(self):
+        """reset() reuses a bundle with a fresh id and clean audit trail."""
+        bundle = ClaimBundle(origin_agent="test", claims=[])
+        bundle.add_gate_result("Evidence Gate", False)
+        bundle.decision = BundleDecision.REFUSE
+        old_id = bundle.id
+
+        claim = Claim(
+            statement="Test",
+            claim_type=ClaimType.INFERENCE,
+            evidence_pointers=[],
+            uncertainty=Uncertainty(
+                method=UncertaintyMethod.CONFIDENCE_SCORE,
+                value=0.5
+            ),
+            risk_tier=RiskTier.READ_ONLY
+        )
+        bundle.reset([claim.to_dict()], origin_agent="other")
+
+        assert bundle.id != old_id
+        assert bundle.origin_agent == "other"
+        assert bundle.decision == BundleDecision.DEFER
+        assert bundle.audit_trail["gates_failed"] == []
+        assert isinstance(bundle.claims[0], Claim)
+
     def test_bundle_json_serialization(self):
         """Test bundle JSON serialization."""
         claim = Claim(
@@ -276,6 +421,28 @@ class TestClaimBundle:
         assert len(restored.claims) == len(original.claims)
         assert restored.claims[0].statement == original.claims[0].statement
 
+    def test_bundle_json_indent_options(self):
+        """Every indent setting encodes the same document."""
+        bundle = ClaimBundle(
+            origin_agent="agent",
+            claims=[
+                Claim(
+                    statement="Tést",
+                    claim_type=ClaimType.INFERENCE,
+                    evidence_pointers=[],
+                    uncertainty=Uncertainty(
+                        method=UncertaintyMethod.CONFIDENCE_SCORE,
+                        value=0.5
+                    ),
+                    risk_tier=RiskTier.READ_ONLY
+                )
+            ]
+        )
+        expected = bundle.to_dict()
+        for indent in (2, None, 4):
+            assert json.loads(bundle.to_json(indent=indent)) == expected
+        assert "\n" not in bundle.to_json(indent=None)
+
     def test_bundle_validation(self):
         """Test bundle validation."""
         claim = Claim(
@@ -295,6 +462,12 @@ class TestClaimBundle:
         errors = bundle.validate()
         assert len(errors) > 0
 
+        # A claim_type reassigned as a plain string is validated the same way
+        claim.claim_type = ClaimType.INFERENCE
+        assert bundle.validate() == []
+        claim.claim_type = "FACT"
+        assert bundle.validate() == claim.validate() != []
+
     def test_add_gate_result(self):
         """Test adding gate results to audit trail."""
         bundle = ClaimBundle(
@@ -25,3 +25,16 @@ class TestMCPToolRegistry:
             {"query": "test"}
         )
         assert is_valid
+
+    def test_tool_permissions(self, mcp_registry):
+        """Test tier checks, including revoked and unknown tools."""
+        mcp_registry.register_tool(name="delete_file", schema={}, required_tier="DELETE")
+
+        assert mcp_registry.is_permitted("web_search", agent_tier=0)
+        assert not mcp_registry.is_permitted("delete_file", agent_tier=2)
+        assert mcp_registry.is_permitted("delete_file", agent_tier=3)
+        assert not mcp_registry.is_permitted("unknown_tool", agent_tier=4)
+
+        mcp_registry.revoke_tool("delete_file")
+        assert not mcp_registry.is_permitted("delete_file", agent_tier=4)
+        assert mcp_registry.get_tool_schema("delete_file") is None
@@ -0,0 +1,186 @@
+"""Tests for Orchestrator.execute."""
+
+from dataclasses import dataclass
+import asyncio
+
+import pytest
+
+from src.orchestrator import Orchestrator
+
+
+def decompose(task):
+    return [f"{task}:a", f"{task}:b"]
+
+
+def execute(subtask):
+    return subtask.upper()
+
+
+def collect(results):
+    return {result: True for result in results}
+
+
+@dataclass
+class Suffix:
+    """Callable dataclass: eq=True leaves it unhashable."""
+    suffix: str
+
+    def __call__(self, subtask):
+        return subtask + self.suffix
+
+
+class TestOrchestratorExecute:
+    """Test Orchestrator.execute."""
+
+    @pytest.mark.asyncio
+    async def test_result_cache_is_opt_in(self):
+        """Without a cache size every submission recomputes."""
+        orchestrator = Orchestrator()
+        first = await orchestrator.execute("task", decompose, execute, collect)
+        second = await orchestrator.execute("task", decompose, execute, collect)
+
+        assert first["success"] and second["success"]
+        assert "cached" not in second
+        assert first["task_id"] != second["task_id"]
+
+    @pytest.mark.asyncio
+    async def test_cached_results_are_isolated_copies(self):
+        """Hits get a fresh task_id and never share nested dicts with the cache."""
+        orchestrator = Orchestrator(result_cache_size=4)
+        first = await orchestrator.execute("task", decompose, execute, collect)
+        first["bundle"]["claims"].clear()
+
+        hit = await orchestrator.execute("task", decompose, execute, collect)
+        assert hit["cached"] is True
+        assert hit["task_id"] != first["task_id"]
+        assert len(hit["bundle"]["claims"]) == 2
+        hit["gate_result"]["reason"] = "edited"
+
+        again = await orchestrator.execute("task", decompose, execute, collect)
+        assert again["gate_result"]["reason"] != "edited"
+
+        orchestrator.clear_result_cache()
+        fresh = await orchestrator.execute("task", decompose, execute, collect)
+        assert "cached" not in fresh
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("result_cache_size", [0, 4])
+    async def test_unhashable_callable_is_not_cached(self, result_cache_size):
+        """Unhashable callables run normally and simply bypass the cache."""
+        orchestrator = Orchestrator(result_cache_size=result_cache_size)
+        first = await orchestrator.execute("task", decompose, Suffix("!"), collect)
+        second = await orchestrator.execute("task", decompose, Suffix("!"), collect)
+
+        assert first["success"] and second["success"]
+        assert "cached" not in second
+        assert not orchestrator._result_cache
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("batch_size", [0, -1])
+    async def test_invalid_batch_size_raises(self, batch_size):
+        """A non-positive batch_size fails fast instead of hanging or being swallowed."""
+        with pytest.raises(ValueError):
+            await Orchestrator().execute("task", decompose, execute, collect, batch_size=batch_size)
+
+    @pytest.mark.asyncio
+    async def test_failed_subtask_cancels_siblings(self):
+        """One failing subtask cancels the rest before execute() returns."""
+        started, finished, cancelled = [], [], []
+
+        async def flaky(subtask):
+            if subtask == "bad":
+                await asyncio.sleep(0)
+                raise RuntimeError("subtask failed")
+            started.append(subtask)
+            try:
+                await asyncio.sleep(0.5)
+            except asyncio.CancelledError:
+                cancelled.append(subtask)
+                raise
+            finished.append(subtask)
+
+        result = await Orchestrator().execute(
+            "task", lambda task: ["slow1", "bad", "slow2"], flaky, collect
+        )
+
+        assert result["success"] is False and result["error"] == "subtask failed"
+        assert sorted(cancelled) == sorted(started) == ["slow1", "slow2"]
+        assert finished == []
+
+
+class TestOrchestratorStreamResults:
+    """Test Orchestrator.execute with stream_results=True."""
+
+    DELAYS = {"slow": 0.05, "medium": 0.02, "fast": 0.0}
+
+    async def sleepy(self, subtask):
+        await asyncio.sleep(self.DELAYS[subtask])
+        return subtask
+
+    @pytest.mark.asyncio
+    async def test_results_stream_in_completion_order(self):
+        """collect_fn sees results as subtasks finish, not in subtask order."""
+        seen = []
+
+        async def collect_stream(stream):
+            async for result in stream:
+                seen.append(result)
+            return {result: True for result in seen}
+
+        result = await Orchestrator().execute(
+            "task", lambda task: list(self.DELAYS), self.sleepy, collect_stream,
+            stream_results=True,
+        )
+
+        assert result["success"] is True
+        assert seen == ["fast", "medium", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_early_stop_cancels_stragglers(self):
+        """Stopping after the first result cancels the unfinished subtasks."""
+        cancelled = []
+
+        async def tracked(subtask):
+            try:
+                return await self.sleepy(subtask)
+            except asyncio.CancelledError:
+                cancelled.append(subtask)
+                raise
+
+        async def first_only(stream):
+            async for result in stream:
+                return {result: True}
+
+        result = await Orchestrator().execute(
+            "task", lambda task: list(self.DELAYS), tracked, first_only,
+            stream_results=True,
+        )
+
+        assert result["success"] is True
+        assert len(result["bundle"]["claims"]) == 1
+        assert sorted(cancelled) == ["medium", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_subtask_error_propagates_and_cancels_siblings(self):
+        """A failing subtask fails the task and cancels the remaining subtasks."""
+        cancelled = []
+
+        async def flaky(subtask):
+            if subtask == "fast":
+                raise RuntimeError("subtask failed")
+            try:
+                return await self.sleepy(subtask)
+            except asyncio.CancelledError:
+                cancelled.append(subtask)
+                raise
+
+        async def collect_stream(stream):
+            return {result: True async for result in stream}
+
+        result = await Orchestrator().execute(
+            "task", lambda task: list(self.DELAYS), flaky, collect_stream,
+            stream_results=True,
+        )
+
+        assert result["success"] is False and result["error"] == "subtask failed"
+        assert sorted(cancelled) == ["medium", "slow"]
@@ -0,0 +1,143 @@
+"""Tests for RedisCheckpointStore."""
+
+import time
+
+import pytest
+
+from src.orchestrator import Orchestrator
+from src.orchestrator_store import RedisCheckpointStore
+
+
+class FakePipeline:
+    """Buffers commands like redis.asyncio's Pipeline and runs them on execute()."""
+
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self):
+        self.client.round_trips += 1
+        return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    """In-memory subset of the Redis commands the store uses."""
+
+    def __init__(self):
+        self.values = {}
+        self.zsets = {}
+        self.ttls = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+        return True
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def zremrangebyscore(self, key, min, max):
+        zset = self.zsets.get(key, {})
+        low = float(min)
+        stale = [k for k, score in zset.items() if low <= score <= max]
+        for k in stale:
+            del zset[k]
+        return len(stale)
+
+    def expire(self, key, seconds):
+        self.ttls[key] = seconds
+        return True
+
+    async def zrevrange(self, key, start, end):
+        self.round_trips += 1
+        ranked = sorted(self.zsets.get(key, {}).items(), key=lambda kv: kv[1], reverse=True)
+        return [k for k, _ in ranked][start:None if end == -1 else end + 1]
+
+    async def get(self, key):
+        self.round_trips += 1
+        return self.values.get(key)
+
+
+class TestRedisCheckpointStore:
+    """Test RedisCheckpointStore."""
+
+    @pytest.mark.asyncio
+    async def test_save_is_one_round_trip_and_index_outlives_blob(self):
+        """Each save is one pipelined round trip that resets the index TTL."""
+        client = FakeRedis()
+        store = RedisCheckpointStore(client=client, ttl_seconds=100)
+
+        await store.save("agent", {"n": 1})
+        assert client.round_trips == 1
+        assert client.ttls["checkpoints:agent"] == 100
+
+        client.ttls["checkpoints:agent"] = 50  # Older than the blob about to be written
+        await store.save("agent", {"n": 2})
+        assert client.round_trips == 2
+        assert client.ttls["checkpoints:agent"] == 100
+
+    @pytest.mark.asyncio
+    async def test_save_trims_index_entries_past_ttl(self):
+        """Keys whose blobs have expired are dropped from the index on save."""
+        client = FakeRedis()
+        store = RedisCheckpointStore(client=client, ttl_seconds=100)
+        client.zsets["checkpoints:agent"] = {"checkpoint:agent:old": time.time() - 200}
+
+        key = await store.save("agent", {"n": 1})
+
+        assert await store.list_keys("agent") == [key]
+
+    @pytest.mark.asyncio
+    async def test_latest_checkpoint_is_chronological(self):
+        """load_latest returns the newest checkpoint for that agent only."""
+        store = RedisCheckpointStore(client=FakeRedis())
+
+        first = await store.save("agent", {"n": 1})
+        second = await store.save("agent", {"n": 2})
+        await store.save("other", {"n": 3})
+
+        assert await store.list_keys("agent") == [second, first]
+        assert await store.load_latest("agent") == {"n": 2}
+        assert await store.load_latest("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_save_checkpoint(self):
+        """Orchestrator persists get_checkpoint() only when a store is configured."""
+        assert await Orchestrator().save_checkpoint() is None
+
+        store = RedisCheckpointStore(client=FakeRedis())
+        orchestrator = Orchestrator(agent_id="planner", checkpoint_store=store)
+        key = await orchestrator.save_checkpoint()
+
+        assert key.startswith("checkpoint:planner:")
+        assert await store.load_latest("planner") == orchestrator.get_checkpoint()
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_emit_checkpoint_snapshots_immediately(self):
+        """emit_checkpoint captures state at call time and writes in the background."""
+        store = RedisCheckpointStore(client=FakeRedis())
+        orchestrator = Orchestrator(agent_id="planner", checkpoint_store=store)
+
+        task = orchestrator.emit_checkpoint()
+        snapshot = orchestrator.get_checkpoint()
+        key = await task
+
+        assert key.startswith("checkpoint:planner:")
+        assert await store.load_latest("planner") == snapshot
+        assert Orchestrator().emit_checkpoint() is None